@@ -5,7 +5,10 @@ This DAG orchestrates the Bronze → Silver → Gold transformation.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import methodcaller
 from pathlib import Path
 
 from airflow.operators.python import PythonOperator
@@ -20,134 +23,59 @@ sys.path.insert(0, str(SHARED_DIR))
 from pipeline import MedallionPipeline
 
 
-def bronze_ingest_stores(**context):
-    pipeline = MedallionPipeline()
-    pipeline.bronze_ingest_stores()
-
-
-def bronze_ingest_products(**context):
-    pipeline = MedallionPipeline()
-    pipeline.bronze_ingest_products()
-
-
-def bronze_ingest_transactions(**context):
-    pipeline = MedallionPipeline()
-    pipeline.bronze_ingest_transactions()
-
-
-def silver_clean_stores(**context):
-    pipeline = MedallionPipeline()
-    pipeline.silver_clean_stores()
-
-
-def silver_clean_products(**context):
-    pipeline = MedallionPipeline()
-    pipeline.silver_clean_products()
-
-
-def silver_enrich_transactions(**context):
-    pipeline = MedallionPipeline()
-    pipeline.silver_enrich_transactions()
-
-
-def gold_yearly_sales(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_yearly_sales()
-
-
-def gold_monthly_sales(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_monthly_sales()
-
-
-def gold_weekly_sales(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_weekly_sales()
-
-
-def gold_daily_sales(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_daily_sales()
-
-
-def gold_sales_by_region(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_sales_by_region()
-
-
-def gold_top_categories(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_top_categories()
-
-
-def gold_hourly_sales(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_hourly_sales()
-
-
-def gold_discount_analysis(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_discount_analysis()
-
-
-def gold_yearly_by_region(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_yearly_by_region()
-
-
-def gold_yearly_by_category(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_yearly_by_category()
-
-
-def gold_yearly_top_products(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_yearly_top_products()
-
-
-def gold_monthly_by_region(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_monthly_by_region()
-
-
-def gold_monthly_by_category(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_monthly_by_category()
-
-
-def gold_monthly_top_products(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_monthly_top_products()
-
-
-def gold_weekly_by_region(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_weekly_by_region()
-
-
-def gold_weekly_by_category(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_weekly_by_category()
-
-
-def gold_weekly_top_products(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_weekly_top_products()
+@lru_cache(maxsize=1)
+def _get_pipeline() -> MedallionPipeline:
+    # One pipeline per worker process; reused by every task it executes
+    return MedallionPipeline()
+
+
+BRONZE_TASKS = [
+    "bronze_ingest_stores",
+    "bronze_ingest_products",
+    "bronze_ingest_transactions",
+]
+
+SILVER_TASKS = [
+    "silver_clean_stores",
+    "silver_clean_products",
+    "silver_enrich_transactions",
+]
+
+# Each batch runs as a single task; its methods are independent of one another
+GOLD_BATCHES = {
+    "gold_overview": [
+        "gold_sales_by_region",
+        "gold_top_categories",
+        "gold_hourly_sales",
+        "gold_discount_analysis",
+        "gold_kpi_summary",
+        "gold_sales_slices",
+    ],
+    **{
+        f"gold_{period}": [f"gold_{period}_sales", f"gold_{period}_drilldowns"]
+        for period in ["yearly", "monthly", "weekly", "daily"]
+    },
+}
 
 
-def gold_daily_by_region(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_daily_by_region()
+CALLS = {
+    name: methodcaller(name)
+    for name in BRONZE_TASKS
+    + SILVER_TASKS
+    + [m for methods in GOLD_BATCHES.values() for m in methods]
+}
 
 
-def gold_daily_by_category(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_daily_by_category()
+def _run(method: str, **context):
+    CALLS[method](_get_pipeline())
 
 
-def gold_daily_top_products(**context):
-    pipeline = MedallionPipeline()
-    pipeline.gold_daily_top_products()
+def _run_batch(methods: list, **context):
+    pipeline = _get_pipeline()
+    with ThreadPoolExecutor(max_workers=len(methods)) as executor:
+        futures = [executor.submit(CALLS[m], pipeline) for m in methods]
+        for future in futures:
+            future.result()
 
 
 default_args = {
@@ -168,162 +96,24 @@ with DAG(
     tags=["retail", "medallion", "lakehouse"],
 ) as dag:
 
-    task_bronze_stores = PythonOperator(
-        task_id="bronze_ingest_stores",
-        python_callable=bronze_ingest_stores,
-    )
-
-    task_bronze_products = PythonOperator(
-        task_id="bronze_ingest_products",
-        python_callable=bronze_ingest_products,
+    bronze_ingest = PythonOperator(
+        task_id="bronze_ingest", python_callable=partial(_run_batch, BRONZE_TASKS)
     )
 
-    task_bronze_transactions = PythonOperator(
-        task_id="bronze_ingest_transactions",
-        python_callable=bronze_ingest_transactions,
-    )
-
-    task_silver_stores = PythonOperator(
-        task_id="silver_clean_stores",
-        python_callable=silver_clean_stores,
-    )
-
-    task_silver_products = PythonOperator(
-        task_id="silver_clean_products",
-        python_callable=silver_clean_products,
-    )
-
-    task_silver_transactions = PythonOperator(
-        task_id="silver_enrich_transactions",
-        python_callable=silver_enrich_transactions,
-    )
-
-    task_gold_yearly = PythonOperator(
-        task_id="gold_yearly_sales",
-        python_callable=gold_yearly_sales,
-    )
-
-    task_gold_monthly = PythonOperator(
-        task_id="gold_monthly_sales",
-        python_callable=gold_monthly_sales,
-    )
-
-    task_gold_weekly = PythonOperator(
-        task_id="gold_weekly_sales",
-        python_callable=gold_weekly_sales,
-    )
-
-    task_gold_daily = PythonOperator(
-        task_id="gold_daily_sales",
-        python_callable=gold_daily_sales,
-    )
-
-    task_gold_sales_region = PythonOperator(
-        task_id="gold_sales_by_region",
-        python_callable=gold_sales_by_region,
-    )
-
-    task_gold_top_categories = PythonOperator(
-        task_id="gold_top_categories",
-        python_callable=gold_top_categories,
-    )
-
-    task_gold_hourly = PythonOperator(
-        task_id="gold_hourly_sales",
-        python_callable=gold_hourly_sales,
-    )
-
-    task_gold_discount = PythonOperator(
-        task_id="gold_discount_analysis",
-        python_callable=gold_discount_analysis,
-    )
-
-    task_gold_yearly_by_region = PythonOperator(
-        task_id="gold_yearly_by_region",
-        python_callable=gold_yearly_by_region,
-    )
-
-    task_gold_yearly_by_category = PythonOperator(
-        task_id="gold_yearly_by_category",
-        python_callable=gold_yearly_by_category,
-    )
-
-    task_gold_yearly_top_products = PythonOperator(
-        task_id="gold_yearly_top_products",
-        python_callable=gold_yearly_top_products,
-    )
-
-    task_gold_monthly_by_region = PythonOperator(
-        task_id="gold_monthly_by_region",
-        python_callable=gold_monthly_by_region,
-    )
-
-    task_gold_monthly_by_category = PythonOperator(
-        task_id="gold_monthly_by_category",
-        python_callable=gold_monthly_by_category,
-    )
-
-    task_gold_monthly_top_products = PythonOperator(
-        task_id="gold_monthly_top_products",
-        python_callable=gold_monthly_top_products,
-    )
-
-    task_gold_weekly_by_region = PythonOperator(
-        task_id="gold_weekly_by_region",
-        python_callable=gold_weekly_by_region,
-    )
-
-    task_gold_weekly_by_category = PythonOperator(
-        task_id="gold_weekly_by_category",
-        python_callable=gold_weekly_by_category,
-    )
-
-    task_gold_weekly_top_products = PythonOperator(
-        task_id="gold_weekly_top_products",
-        python_callable=gold_weekly_top_products,
-    )
-
-    task_gold_daily_by_region = PythonOperator(
-        task_id="gold_daily_by_region",
-        python_callable=gold_daily_by_region,
-    )
-
-    task_gold_daily_by_category = PythonOperator(
-        task_id="gold_daily_by_category",
-        python_callable=gold_daily_by_category,
-    )
+    tasks = {
+        name: PythonOperator(task_id=name, python_callable=partial(_run, name))
+        for name in SILVER_TASKS
+    }
 
-    task_gold_daily_top_products = PythonOperator(
-        task_id="gold_daily_top_products",
-        python_callable=gold_daily_top_products,
+    (
+        bronze_ingest
+        >> [tasks["silver_clean_stores"], tasks["silver_clean_products"]]
+        >> tasks["silver_enrich_transactions"]
     )
 
-    [task_bronze_stores, task_bronze_products, task_bronze_transactions]
-
-    task_bronze_stores >> task_silver_stores
-    task_bronze_products >> task_silver_products
-    task_bronze_transactions >> task_silver_transactions
-    [task_silver_stores, task_silver_products] >> task_silver_transactions
-
-    task_silver_transactions >> [
-        task_gold_yearly,
-        task_gold_monthly,
-        task_gold_weekly,
-        task_gold_daily,
-        task_gold_sales_region,
-        task_gold_top_categories,
-        task_gold_hourly,
-        task_gold_discount,
-        task_gold_yearly_by_region,
-        task_gold_yearly_by_category,
-        task_gold_yearly_top_products,
-        task_gold_monthly_by_region,
-        task_gold_monthly_by_category,
-        task_gold_monthly_top_products,
-        task_gold_weekly_by_region,
-        task_gold_weekly_by_category,
-        task_gold_weekly_top_products,
-        task_gold_daily_by_region,
-        task_gold_daily_by_category,
-        task_gold_daily_top_products,
+    gold_tasks = [
+        PythonOperator(task_id=batch, python_callable=partial(_run_batch, methods))
+        for batch, methods in GOLD_BATCHES.items()
     ]
+
+    tasks["silver_enrich_transactions"] >> gold_tasks
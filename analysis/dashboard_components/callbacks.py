@@ -1,10 +1,138 @@
 """Dashboard callbacks for interactivity."""
 
-from dash import Input, Output
+from dash import Input, Output, State, no_update
 import polars as pl
 
 from . import data_loaders as dl
 from . import charts
+from .filters import DEFAULT_FILTER_STATE
+
+KPI_IDS = ["kpi-total-sales", "kpi-total-transactions", "kpi-avg-transaction", "kpi-years"]
+
+# tab -> graph ids, in the order the tab's figure builder returns them
+CHART_IDS = {
+    "overview": ["overview-yearly-chart", "overview-region-chart", "overview-category-chart"],
+    "yearly": ["yearly-drill-chart"],
+    "monthly": ["monthly-drill-chart"],
+    "weekly": ["weekly-drill-chart"],
+}
+
+# Drill-down region/category graphs, redrawn in the browser from the slice store
+SLICE_CHART_IDS = [
+    f"{tab}-{dimension}-chart"
+    for tab in ("yearly", "monthly", "weekly")
+    for dimension in ("region", "category")
+]
+
+
+MONTH_NAMES = {
+    1: "January", 2: "February", 3: "March", 4: "April",
+    5: "May", 6: "June", 7: "July", 8: "August",
+    9: "September", 10: "October", 11: "November", 12: "December",
+}
+
+
+@charts.memoize_on_frames(maxsize=8)
+def periods_by_year(df, year_col, period_col):
+    """Map each year to its sorted months/weeks; built once per loaded table."""
+    grouped = df.group_by(year_col).agg(pl.col(period_col).unique().sort())
+    return dict(zip(grouped[year_col].to_list(), grouped[period_col].to_list()))
+
+
+def kpi_values(aggregated_dir, state):
+    """KPI card texts for a filter state."""
+    df = dl.load_kpi_summary(aggregated_dir)
+    if df.is_empty():
+        return "€0", "0", "€0.00", "0"
+
+    # KPIs are yearly grain: month/week selections show all-years totals
+    year = state["year"] if state["filter_type"] == "year" else None
+    df = df.filter(pl.col("year").eq_missing(year))
+    if df.is_empty():
+        return "€0", "0", "€0.00", "0"
+
+    row = df.row(0, named=True)
+    return (
+        f"€{row['total_sales']:,.0f}",
+        f"{row['num_transactions']:,}",
+        f"€{row['avg_transaction_value']:.2f}",
+        f"{row['num_years']}",
+    )
+
+
+def overview_figures(aggregated_dir, state):
+    return (
+        charts.create_overview_yearly_chart(dl.load_yearly_sales(aggregated_dir), **state),
+        charts.create_overview_region_chart(dl.load_sales_by_region(aggregated_dir), **state),
+        charts.create_overview_category_chart(dl.load_top_categories(aggregated_dir), **state),
+    )
+
+
+def yearly_figures(aggregated_dir, state):
+    df_yearly = dl.load_yearly_sales(aggregated_dir)
+    df_monthly = dl.load_monthly_sales(aggregated_dir)
+    return (charts.create_yearly_drill_chart(df_yearly, df_monthly, **state),)
+
+
+def monthly_figures(aggregated_dir, state):
+    return (charts.create_monthly_drill_chart(dl.load_daily_sales(aggregated_dir), **state),)
+
+
+def weekly_figures(aggregated_dir, state):
+    return (charts.create_weekly_drill_chart(dl.load_daily_sales(aggregated_dir), **state),)
+
+
+TAB_FIGURES = {
+    "overview": overview_figures,
+    "yearly": yearly_figures,
+    "monthly": monthly_figures,
+    "weekly": weekly_figures,
+}
+
+
+def slice_figures(aggregated_dir, state):
+    """Region and category figures for every drill-down tab, in SLICE_CHART_IDS order."""
+    region = charts.create_region_chart(dl.load_region_slices(aggregated_dir), **state)
+    category = charts.create_category_chart(dl.load_category_slices(aggregated_dir), **state)
+    return (region, category) * 3
+
+
+@charts.memoize_on_frames(maxsize=4)
+def _columns(frame):
+    return frame.collect().to_dict(as_series=False)
+
+
+def slice_store(aggregated_dir):
+    """Sales slices as column lists plus the chart template, for the clientside charts."""
+    return {
+        "template": charts.TEMPLATE,
+        "region": _columns(dl.load_region_slices(aggregated_dir)),
+        "category": _columns(dl.load_category_slices(aggregated_dir)),
+    }
+
+
+def year_options(aggregated_dir):
+    """Year dropdown options, oldest first."""
+    df = dl.load_yearly_sales(aggregated_dir)
+    if df.is_empty():
+        return []
+    return [{"label": str(year), "value": year} for year in df["year"].unique().sort().to_list()]
+
+
+def initial_values(aggregated_dir):
+    """Year options, slice store, KPI texts and figures for the default filter state, by id.
+
+    Inlined into the layout so the first paint needs no callback round-trip.
+    """
+    values = {
+        "global-year": year_options(aggregated_dir),
+        "slice-store": slice_store(aggregated_dir),
+    }
+    values.update(zip(KPI_IDS, kpi_values(aggregated_dir, DEFAULT_FILTER_STATE)))
+    for tab, build in TAB_FIGURES.items():
+        values.update(zip(CHART_IDS[tab], build(aggregated_dir, DEFAULT_FILTER_STATE)))
+    values.update(zip(SLICE_CHART_IDS, slice_figures(aggregated_dir, DEFAULT_FILTER_STATE)))
+    return values
 
 
 def register_callbacks(app, aggregated_dir):
@@ -14,7 +142,22 @@ def register_callbacks(app, aggregated_dir):
     # TAB-BASED FILTER VISIBILITY
     # ========================================================================
 
-    @app.callback(
+    # Runs in the browser; tab switches don't need a server round-trip
+    app.clientside_callback(
+        """
+        function(activeTab) {
+            var hide = {"display": "none"}, show = {"display": "block"};
+            // Overview: No filters
+            if (activeTab === "overview") { return [hide, hide, hide]; }
+            // Yearly: Only year filter
+            if (activeTab === "yearly") { return [show, hide, hide]; }
+            // Monthly: Year + Month filters
+            if (activeTab === "monthly") { return [show, show, hide]; }
+            // Weekly: Year + Week filters
+            if (activeTab === "weekly") { return [show, hide, show]; }
+            return [hide, hide, hide];
+        }
+        """,
         [
             Output("year-filter-col", "style"),
             Output("month-filter-col", "style"),
@@ -22,94 +165,71 @@ def register_callbacks(app, aggregated_dir):
         ],
         Input("tabs", "active_tab"),
     )
-    def update_filter_visibility(active_tab):
-        """Show/hide filters based on active tab."""
-        # Overview: No filters
-        if active_tab == "overview":
-            return {"display": "none"}, {"display": "none"}, {"display": "none"}
-        # Yearly: Only year filter
-        elif active_tab == "yearly":
-            return {"display": "block"}, {"display": "none"}, {"display": "none"}
-        # Monthly: Year + Month filters
-        elif active_tab == "monthly":
-            return {"display": "block"}, {"display": "block"}, {"display": "none"}
-        # Weekly: Year + Week filters
-        elif active_tab == "weekly":
-            return {"display": "block"}, {"display": "none"}, {"display": "block"}
-        return {"display": "none"}, {"display": "none"}, {"display": "none"}
 
     # ========================================================================
-    # KPI CALCULATIONS
+    # SHARED FILTER STATE
     # ========================================================================
 
     @app.callback(
-        [
-            Output("kpi-total-sales", "children"),
-            Output("kpi-total-transactions", "children"),
-            Output("kpi-avg-transaction", "children"),
-            Output("kpi-years", "children"),
-        ],
+        Output("filter-state", "data"),
         [
             Input("tabs", "active_tab"),
             Input("global-year", "value"),
             Input("global-month", "value"),
             Input("global-week", "value"),
         ],
+        State("filter-state", "data"),
     )
-    def update_kpis(active_tab, year, month, week):
-        # Determine filter type from active tab
+    def update_filter_state(active_tab, year, month, week, current):
+        """Resolve the active filter once for every chart and KPI callback."""
         filter_type = "default"
         if year:
             filter_type = "year"
-        if active_tab == "monthly" and month:
-            filter_type = "month"
-        elif active_tab == "weekly" and week:
-            filter_type = "week"
-
-        df = dl.load_yearly_sales(aggregated_dir)
-        if df.is_empty():
-            return "€0", "0", "€0.00", "0"
-
-        # Apply filter
-        df = charts.apply_global_filter(df, filter_type, year, month, week)
+            if active_tab == "monthly" and month:
+                filter_type = "month"
+            elif active_tab == "weekly" and week:
+                filter_type = "week"
+
+        # Values the active filter ignores don't reach the charts
+        state = {
+            "filter_type": filter_type,
+            "year": year,
+            "month": month if filter_type == "month" else None,
+            "week": week if filter_type == "week" else None,
+        }
+        # Leaving the store untouched keeps every chart callback from firing
+        if state == current:
+            return no_update
+        return state
 
-        total_sales = df["total_sales"].sum()
-        total_transactions = df["num_transactions"].sum()
-        avg_transaction = total_sales / total_transactions if total_transactions > 0 else 0
-        num_years = df["year"].n_unique()
+    # ========================================================================
+    # KPI CALCULATIONS
+    # ========================================================================
 
-        return (
-            f"€{total_sales:,.0f}",
-            f"{total_transactions:,}",
-            f"€{avg_transaction:.2f}",
-            f"{num_years}",
-        )
+    # The layout already carries the default-state values, so no initial call
+    @app.callback(
+        [Output(kpi_id, "children") for kpi_id in KPI_IDS],
+        Input("filter-state", "data"),
+        prevent_initial_call=True,
+    )
+    def update_kpis(state):
+        return kpi_values(aggregated_dir, state)
 
     # ========================================================================
     # FILTER DROPDOWNS POPULATION
     # ========================================================================
 
+    # Year options are part of the served layout; tab switches only pick the value
     @app.callback(
-        [
-            Output("global-year", "options"),
-            Output("global-year", "value"),
-        ],
+        Output("global-year", "value"),
         Input("tabs", "active_tab"),
+        State("global-year", "options"),
     )
-    def populate_year_dropdown(active_tab):
-        df = dl.load_yearly_sales(aggregated_dir)
-        if df.is_empty():
-            return [], None
-
-        years = sorted(df["year"].unique().to_list())
-        options = [{"label": str(year), "value": year} for year in years]
-
+    def select_default_year(active_tab, options):
         # Default to latest year only for yearly/monthly/weekly tabs, None for overview
-        if active_tab == "overview":
-            return options, None
-        else:
-            latest_year = years[-1] if years else None
-            return options, latest_year
+        if active_tab == "overview" or not options:
+            return None
+        return options[-1]["value"]
 
     @app.callback(
         [
@@ -126,16 +246,9 @@ def register_callbacks(app, aggregated_dir):
         if df.is_empty():
             return [], None
 
-        df = df.filter(pl.col("year") == year)
-        months = sorted(df["month"].unique().to_list())
-
-        month_names = {
-            1: "January", 2: "February", 3: "March", 4: "April",
-            5: "May", 6: "June", 7: "July", 8: "August",
-            9: "September", 10: "October", 11: "November", 12: "December",
-        }
+        months = periods_by_year(df, "year", "month").get(year, [])
 
-        options = [{"label": month_names[m], "value": m} for m in months]
+        options = [{"label": MONTH_NAMES[m], "value": m} for m in months]
         # Default to latest month
         latest_month = months[-1] if months else None
         return options, latest_month
@@ -156,9 +269,7 @@ def register_callbacks(app, aggregated_dir):
         if df.is_empty():
             return [], None
 
-        # Filter by the selected year
-        df = df.filter(pl.col("iso_year") == year)
-        weeks = sorted(df["iso_week"].unique().to_list())
+        weeks = periods_by_year(df, "iso_year", "iso_week").get(year, [])
 
         options = [{"label": f"Week {w}", "value": w} for w in weeks]
         # Default to latest week
@@ -169,195 +280,116 @@ def register_callbacks(app, aggregated_dir):
     # OVERVIEW TAB CALLBACKS
     # ========================================================================
 
-    @app.callback(
-        Output("overview-yearly-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-        ],
-    )
-    def update_overview_yearly(active_tab, year):
-        filter_type = "year" if year else "default"
-        df = dl.load_yearly_sales(aggregated_dir)
-        return charts.create_overview_yearly_chart(df, filter_type, year, None, None)
+    # One callback per tab: a filter change costs one round-trip per tab, not per chart
+    # The layout already carries the default-state figures, so no initial call
 
     @app.callback(
-        Output("overview-region-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-        ],
-    )
-    def update_overview_region(active_tab, year):
-        filter_type = "year" if year else "default"
-        df = dl.load_sales_by_region(aggregated_dir)
-        return charts.create_overview_region_chart(df, filter_type, year, None, None)
-
-    @app.callback(
-        Output("overview-category-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-        ],
+        [Output(graph_id, "figure") for graph_id in CHART_IDS["overview"]],
+        Input("filter-state", "data"),
+        prevent_initial_call=True,
     )
-    def update_overview_category(active_tab, year):
-        filter_type = "year" if year else "default"
-        df = dl.load_top_categories(aggregated_dir)
-        return charts.create_overview_category_chart(df, filter_type, year, None, None)
+    def update_overview_charts(state):
+        return overview_figures(aggregated_dir, state)
 
     # ========================================================================
     # YEARLY DRILL-DOWN TAB CALLBACKS
     # ========================================================================
 
     @app.callback(
-        Output("yearly-drill-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-        ],
-    )
-    def update_yearly_drill(active_tab, year):
-        filter_type = "year" if year else "default"
-        df_yearly = dl.load_yearly_sales(aggregated_dir)
-        df_monthly = dl.load_monthly_sales(aggregated_dir)
-        return charts.create_yearly_drill_chart(df_yearly, df_monthly, filter_type, year, None, None)
-
-    @app.callback(
-        Output("yearly-region-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-        ],
-    )
-    def update_yearly_region(active_tab, year):
-        filter_type = "year" if year else "default"
-        df = dl.load_yearly_by_region(aggregated_dir)
-        return charts.create_yearly_region_chart(df, filter_type, year, None, None)
-
-    @app.callback(
-        Output("yearly-category-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-        ],
+        [Output(graph_id, "figure") for graph_id in CHART_IDS["yearly"]],
+        Input("filter-state", "data"),
+        prevent_initial_call=True,
     )
-    def update_yearly_category(active_tab, year):
-        filter_type = "year" if year else "default"
-        df = dl.load_yearly_by_category(aggregated_dir)
-        return charts.create_yearly_category_chart(df, filter_type, year, None, None)
+    def update_yearly_charts(state):
+        return yearly_figures(aggregated_dir, state)
 
     # ========================================================================
     # MONTHLY DRILL-DOWN TAB CALLBACKS (Shows daily breakdown)
     # ========================================================================
 
     @app.callback(
-        Output("monthly-drill-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-            Input("global-month", "value"),
-        ],
-    )
-    def update_monthly_drill(active_tab, year, month):
-        filter_type = "default"
-        if year and month:
-            filter_type = "month"
-        elif year:
-            filter_type = "year"
-
-        df = dl.load_daily_sales(aggregated_dir)
-        return charts.create_monthly_drill_chart(df, filter_type, year, month, None)
-
-    @app.callback(
-        Output("monthly-region-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-            Input("global-month", "value"),
-        ],
-    )
-    def update_monthly_region(active_tab, year, month):
-        filter_type = "default"
-        if year and month:
-            filter_type = "month"
-        elif year:
-            filter_type = "year"
-
-        df = dl.load_daily_by_region(aggregated_dir)
-        return charts.create_monthly_region_chart(df, filter_type, year, month, None)
-
-    @app.callback(
-        Output("monthly-category-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-            Input("global-month", "value"),
-        ],
+        [Output(graph_id, "figure") for graph_id in CHART_IDS["monthly"]],
+        Input("filter-state", "data"),
+        prevent_initial_call=True,
     )
-    def update_monthly_category(active_tab, year, month):
-        filter_type = "default"
-        if year and month:
-            filter_type = "month"
-        elif year:
-            filter_type = "year"
-
-        df = dl.load_daily_by_category(aggregated_dir)
-        return charts.create_monthly_category_chart(df, filter_type, year, month, None)
+    def update_monthly_charts(state):
+        return monthly_figures(aggregated_dir, state)
 
     # ========================================================================
     # WEEKLY DRILL-DOWN TAB CALLBACKS (Shows daily breakdown)
     # ========================================================================
 
     @app.callback(
-        Output("weekly-drill-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-            Input("global-week", "value"),
-        ],
+        [Output(graph_id, "figure") for graph_id in CHART_IDS["weekly"]],
+        Input("filter-state", "data"),
+        prevent_initial_call=True,
     )
-    def update_weekly_drill(active_tab, year, week):
-        filter_type = "default"
-        if year and week:
-            filter_type = "week"
-        elif year:
-            filter_type = "year"
+    def update_weekly_charts(state):
+        return weekly_figures(aggregated_dir, state)
 
-        df = dl.load_daily_sales(aggregated_dir)
-        return charts.create_weekly_drill_chart(df, filter_type, year, None, week)
-
-    @app.callback(
-        Output("weekly-region-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-            Input("global-week", "value"),
-        ],
-    )
-    def update_weekly_region(active_tab, year, week):
-        filter_type = "default"
-        if year and week:
-            filter_type = "week"
-        elif year:
-            filter_type = "year"
-
-        df = dl.load_daily_by_region(aggregated_dir)
-        return charts.create_weekly_region_chart(df, filter_type, year, None, week)
+    # ========================================================================
+    # DRILL-DOWN REGION/CATEGORY CHARTS (Clientside, from the slice store)
+    # ========================================================================
 
-    @app.callback(
-        Output("weekly-category-chart", "figure"),
-        [
-            Input("tabs", "active_tab"),
-            Input("global-year", "value"),
-            Input("global-week", "value"),
-        ],
+    # Mirrors charts.lookup_slice and create_region/category_chart; slices are
+    # stored largest-first, so a filtered scan is already in display order
+    app.clientside_callback(
+        """
+        function(state, store) {
+            var empty = {data: [], layout: {height: 400, template: store && store.template}};
+            var year = state.year, month = state.month, week = state.week;
+            var type = state.filter_type;
+
+            var grain = "all";
+            if (year) {
+                if (type === "year") { grain = "year"; }
+                else if (type === "month" && month) { grain = "month"; }
+                else if (type === "week" && week) { grain = "week"; }
+            }
+            var keys = {
+                all: [], year: ["year"], month: ["year", "month"], week: ["year", "week"],
+            }[grain];
+            var values = {year: year, month: month, week: week};
+
+            var suffix = "";
+            if (type === "month" && year && month) {
+                suffix = " - " + year + "-" + String(month).padStart(2, "0");
+            } else if (type === "week" && year && week) {
+                suffix = " - " + year + " Week " + week;
+            } else if (type === "year" && year) {
+                suffix = " - " + year;
+            }
+
+            function bars(column, title, xaxisTitle, color, topN) {
+                var t = store && store[column];
+                if (!t || !t.grain) { return empty; }
+                var x = [], y = [];
+                for (var i = 0; i < t.grain.length && !(topN && x.length >= topN); i++) {
+                    if (t.grain[i] !== grain) { continue; }
+                    if (keys.some(function(k) { return t[k][i] !== values[k]; })) { continue; }
+                    x.push(t[column][i]);
+                    y.push(t.total_sales[i]);
+                }
+                if (!x.length) { return empty; }
+                return {
+                    data: [{type: "bar", x: x, y: y, marker: {color: color}}],
+                    layout: {
+                        template: store.template,
+                        title: {text: title + suffix},
+                        xaxis: {title: {text: xaxisTitle}, tickangle: -45},
+                        yaxis: {title: {text: "Total Sales (€)"}},
+                        height: 400,
+                    },
+                };
+            }
+
+            var region = bars("region", "Sales by Region", "Region", "teal");
+            var category = bars("category", "Top 10 Categories", "Category", "purple", 10);
+            return [region, category, region, category, region, category];
+        }
+        """,
+        [Output(graph_id, "figure") for graph_id in SLICE_CHART_IDS],
+        Input("filter-state", "data"),
+        State("slice-store", "data"),
+        prevent_initial_call=True,
     )
-    def update_weekly_category(active_tab, year, week):
-        filter_type = "default"
-        if year and week:
-            filter_type = "week"
-        elif year:
-            filter_type = "year"
-
-        df = dl.load_daily_by_category(aggregated_dir)
-        return charts.create_weekly_category_chart(df, filter_type, year, None, week)
@@ -1,35 +1,228 @@
 """Chart creation functions for the dashboard."""
 
-import plotly.graph_objects as go
-import polars as pl
+import json
+from collections import OrderedDict
+from functools import lru_cache, partial, wraps
+from threading import Lock
 
+import numpy as np
+import plotly.io as pio
+import polars as pl
+from plotly.io.json import to_json_plotly
+
+
+# Figures are plain dicts: go.Figure validates every property on construction,
+# Dash only needs the JSON. The template is what go.Figure would have attached,
+# cut down to the trace types and layout parts these charts use, since it is
+# sent with every figure.
+CHART_TRACE_TYPES = ("bar", "scatter", "scattergl")
+CHART_LAYOUT_KEYS = (
+    "autotypenumbers",
+    "colorway",
+    "font",
+    "hoverlabel",
+    "hovermode",
+    "paper_bgcolor",
+    "plot_bgcolor",
+    "title",
+    "xaxis",
+    "yaxis",
+)
+
+
+def _chart_template():
+    template = pio.templates[pio.templates.default].to_plotly_json()
+    return {
+        "data": {k: v for k, v in template.get("data", {}).items() if k in CHART_TRACE_TYPES},
+        "layout": {k: v for k, v in template.get("layout", {}).items() if k in CHART_LAYOUT_KEYS},
+    }
+
+
+TEMPLATE = _chart_template()
+
+# Shared by every empty-result branch; Dash only serializes it, never mutates it
+EMPTY_FIGURE = {"data": [], "layout": {"height": 400, "template": TEMPLATE}}
+
+
+def memoize_on_frames(maxsize=64, prejson=False):
+    """Memoize a builder on the identity of its frame arguments plus its other arguments.
+
+    Loaders hand back the same cached frame until its parquet file changes, so
+    identity is an exact key. Frames are stored alongside each result so a
+    recycled id() can never return another frame's result. With `prejson`,
+    results are cached already converted to JSON types (numpy arrays become
+    lists), so a cache hit leaves Dash only plain builtins to encode.
+    """
 
+    def decorator(func):
+        cache = OrderedDict()
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            frames = tuple(a for a in args if isinstance(a, (pl.DataFrame, pl.LazyFrame)))
+            rest = tuple(a for a in args if not isinstance(a, (pl.DataFrame, pl.LazyFrame)))
+            key = (tuple(map(id, frames)), rest, tuple(sorted(kwargs.items())))
+
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and all(a is b for a, b in zip(hit[0], frames)):
+                    cache.move_to_end(key)
+                    return hit[1]
+
+            result = func(*args, **kwargs)
+            if prejson:
+                result = json.loads(to_json_plotly(result))
+
+            with lock:
+                cache[key] = (frames, result)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# filter_type -> [(required columns, predicate builder)], first matching schema wins
+FILTER_DISPATCH = {
+    "year": [
+        (("year",), lambda year, month, week: pl.col("year") == year),
+        (("iso_year",), lambda year, month, week: pl.col("iso_year") == year),
+    ],
+    "month": [
+        (
+            ("year", "month"),
+            lambda year, month, week: (pl.col("year") == year) & (pl.col("month") == month),
+        ),
+    ],
+    "week": [
+        (
+            ("iso_year", "iso_week"),
+            lambda year, month, week: (pl.col("iso_year") == year) & (pl.col("iso_week") == week),
+        ),
+        # For daily data, derive iso_year and iso_week from date column
+        (
+            ("date",),
+            lambda year, month, week: (pl.col("date").dt.iso_year() == year)
+            & (pl.col("date").dt.week() == week),
+        ),
+    ],
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve_filter(filter_type, columns):
+    """Pick the predicate builder for a schema once per (filter_type, columns)."""
+    for required, build in FILTER_DISPATCH.get(filter_type, []):
+        if columns.issuperset(required):
+            return build
+    return None
+
+
+@lru_cache(maxsize=256)
+def _filter_expr(filter_type, columns, year, month, week):
+    """Build the predicate once per schema and filter values; expressions are reusable."""
+    build = _resolve_filter(filter_type, columns)
+    return None if build is None else build(year, month, week)
+
+
+@memoize_on_frames()
 def apply_global_filter(df, filter_type, year=None, month=None, week=None):
-    """Apply global filter to dataframe based on filter type."""
+    """Apply global filter to dataframe based on filter type.
+
+    LazyFrames are filtered before collecting, so the parquet reader can
+    skip row groups outside the selected period. Results are memoized, so
+    charts sharing a source table and filter reuse one filtered frame.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return _filter_frame(df, filter_type, year, month, week).collect(engine="streaming")
+
     if df.is_empty():
         return df
+    return _filter_frame(df, filter_type, year, month, week)
 
-    if filter_type == "year" and year:
-        if "year" in df.columns:
-            df = df.filter(pl.col("year") == year)
-        elif "iso_year" in df.columns:
-            df = df.filter(pl.col("iso_year") == year)
 
-    elif filter_type == "month" and year and month:
-        if "year" in df.columns and "month" in df.columns:
-            df = df.filter((pl.col("year") == year) & (pl.col("month") == month))
+def _filter_frame(df, filter_type, year, month, week):
+    if not year:
+        return df
+    if (filter_type == "month" and not month) or (filter_type == "week" and not week):
+        return df
 
-    elif filter_type == "week" and year and week:
-        if "iso_year" in df.columns and "iso_week" in df.columns:
-            df = df.filter((pl.col("iso_year") == year) & (pl.col("iso_week") == week))
-        elif "date" in df.columns:
-            # For daily data, derive iso_year and iso_week from date column
-            df = df.filter(
-                (pl.col("date").dt.iso_year() == year) &
-                (pl.col("date").dt.week() == week)
-            )
+    expr = _filter_expr(filter_type, frozenset(df.collect_schema().names()), year, month, week)
+    if expr is None:
+        return df
+    return df.filter(expr)
+
+
+# Slice grain -> key columns it is filtered on, as written by gold_sales_slices
+SLICE_KEYS = {"all": (), "year": ("year",), "month": ("year", "month"), "week": ("year", "week")}
+
+
+@memoize_on_frames()
+def lookup_slice(df, column, filter_type, year=None, month=None, week=None, top_n=None):
+    """Read one pre-aggregated breakdown from a sales_slices dataset."""
+    frame = df.lazy()
+    if column not in frame.collect_schema().names():
+        return pl.DataFrame()
+
+    grain = "all"
+    if year:
+        if filter_type == "year":
+            grain = "year"
+        elif filter_type == "month" and month:
+            grain = "month"
+        elif filter_type == "week" and week:
+            grain = "week"
+
+    values = {"year": year, "month": month, "week": week}
+    query = frame.filter(
+        pl.col("grain") == grain, *[pl.col(k) == values[k] for k in SLICE_KEYS[grain]]
+    ).select([column, "total_sales"])
+    # Slices are written sorted by total_sales descending, and filtering keeps that order
+    if top_n:
+        query = query.head(top_n)
+    return query.collect()
+
+
+# Daily drill charts never send more points than this to the browser
+MAX_LINE_POINTS = 500
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of `n_out` points that keep the line's shape."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        # Pick the point in this bucket spanning the largest triangle with
+        # the previous pick and the next bucket's centroid
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
 
-    return df
+
+def downsample_line(df, x_col, y_col, max_points=MAX_LINE_POINTS):
+    """Reduce a sorted line series to at most `max_points` rows via LTTB."""
+    if df.height <= max_points:
+        return df
+    x = df[x_col].to_physical().to_numpy().astype(np.float64)
+    y = df[y_col].to_numpy().astype(np.float64)
+    return df[lttb_indices(x, y, max_points)]
 
 
 def get_filter_title(filter_type, year=None, month=None, week=None):
@@ -43,465 +236,233 @@ def get_filter_title(filter_type, year=None, month=None, week=None):
     return ""
 
 
+@lru_cache(maxsize=256)
+def chart_title(prefix, filter_type, year=None, month=None, week=None):
+    """Chart title for a filter state, e.g. "Sales by Region - 2024"."""
+    return prefix + get_filter_title(filter_type, year, month, week)
+
+
+def chart_layout(title, xaxis_title, tickangle=None, hovermode=None):
+    """Build the layout shared by all dashboard charts."""
+    xaxis = {"title": {"text": xaxis_title}}
+    if tickangle is not None:
+        xaxis["tickangle"] = tickangle
+    layout = {
+        "template": TEMPLATE,
+        "title": {"text": title},
+        "xaxis": xaxis,
+        "yaxis": {"title": {"text": "Total Sales (€)"}},
+        "height": 400,
+    }
+    if hovermode:
+        layout["hovermode"] = hovermode
+    return layout
+
+
+def euro_labels(series):
+    """Format a sales Series as bar labels, e.g. "€1,234"."""
+    # to_list() converts in one native pass; iterating the Series boxes per element
+    return [f"€{x:,.0f}" for x in series.to_list()]
+
+
+def bar_figure(x, y, title, xaxis_title, color, tickangle=-45, hovermode=None, **trace):
+    """Build a bar chart figure with the shared layout."""
+    return {
+        "data": [{"type": "bar", "x": x, "y": y, "marker": {"color": color}, **trace}],
+        "layout": chart_layout(title, xaxis_title, tickangle=tickangle, hovermode=hovermode),
+    }
+
+
+def line_figure(x, y, title, xaxis_title, color, marker_size, trace_type="scatter"):
+    """Build a lines+markers sales trend figure with the shared layout."""
+    return {
+        "data": [
+            {
+                "type": trace_type,
+                "x": x,
+                "y": y,
+                "mode": "lines+markers",
+                "name": "Total Sales",
+                "line": {"color": color, "width": 2},
+                "marker": {"size": marker_size},
+            }
+        ],
+        "layout": chart_layout(title, xaxis_title, hovermode="x unified"),
+    }
+
+
 # ============================================================================
-# OVERVIEW TAB CHARTS
+# SHARED DRILL-DOWN CHARTS (Same builder on every drill-down tab)
 # ============================================================================
 
-def create_overview_yearly_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create yearly sales overview chart."""
-    df = apply_global_filter(df, filter_type, year, month, week)
+@memoize_on_frames(prejson=True)
+def create_region_chart(df, filter_type="default", year=None, month=None, week=None):
+    """Create sales by region chart from the precomputed region slices."""
+    df = lookup_slice(df, "region", filter_type, year, month, week)
 
     if df.is_empty():
-        return go.Figure()
+        return EMPTY_FIGURE
 
-    df_pd = df.to_pandas()
+    title = chart_title("Sales by Region", filter_type, year, month, week)
 
-    # Use bar chart if single value, line chart for multiple years
-    if len(df_pd) == 1:
-        fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=df_pd["year"].astype(str),
-                    y=df_pd["total_sales"],
-                    marker_color="royalblue",
-                    text=df_pd["total_sales"].apply(lambda x: f"€{x:,.0f}"),
-                    textposition="outside",
-                )
-            ]
-        )
-    else:
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=df_pd["year"],
-                y=df_pd["total_sales"],
-                mode="lines+markers",
-                name="Total Sales",
-                line=dict(color="royalblue", width=2),
-                marker=dict(size=8),
-            )
-        )
-
-    title = "Yearly Sales" + get_filter_title(filter_type, year, month, week)
-
-    fig.update_layout(
-        title=title,
-        xaxis_title="Year",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        hovermode="x unified",
-    )
+    return bar_figure(df["region"].to_list(), df["total_sales"].to_numpy(), title, "Region", "teal")
 
-    return fig
 
-
-def create_overview_region_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create sales by region chart for overview."""
-    df = apply_global_filter(df, filter_type, year, month, week)
+@memoize_on_frames(prejson=True)
+def create_category_chart(df, filter_type="default", year=None, month=None, week=None):
+    """Create top 10 categories chart from the precomputed category slices."""
+    df = lookup_slice(df, "category", filter_type, year, month, week, top_n=10)
 
     if df.is_empty():
-        return go.Figure()
-
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["region"],
-                y=df_pd["total_sales"],
-                marker_color="teal",
-            )
-        ]
-    )
+        return EMPTY_FIGURE
 
-    title = "Sales by Region" + get_filter_title(filter_type, year, month, week)
+    title = chart_title("Top 10 Categories", filter_type, year, month, week)
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Region",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
+    return bar_figure(
+        df["category"].to_list(), df["total_sales"].to_numpy(), title, "Category", "purple"
     )
 
-    return fig
-
 
-def create_overview_category_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create top categories chart for overview."""
+@memoize_on_frames(prejson=True)
+def create_daily_drill_chart(
+    df, filter_type="default", year=None, month=None, week=None, color="orange", marker_size=4
+):
+    """Create daily sales drill-down chart for the filtered period."""
     df = apply_global_filter(df, filter_type, year, month, week)
 
     if df.is_empty():
-        return go.Figure()
-
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["category"],
-                y=df_pd["total_sales"],
-                marker_color="purple",
-            )
-        ]
-    )
+        return EMPTY_FIGURE
 
-    title = "Top 10 Categories" + get_filter_title(filter_type, year, month, week)
+    df = downsample_line(df.sort("date"), "date", "total_sales")
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Category",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
-    )
+    title = chart_title("Daily Sales", filter_type, year, month, week)
 
-    return fig
+    # Hundreds of markers per line: WebGL draws them in one pass instead of one SVG node each
+    return line_figure(
+        df["date"].to_numpy(),
+        df["total_sales"].to_numpy(),
+        title,
+        "Date",
+        color,
+        marker_size,
+        trace_type="scattergl",
+    )
 
 
 # ============================================================================
-# YEARLY DRILL-DOWN TAB CHARTS
+# OVERVIEW TAB CHARTS
 # ============================================================================
 
-def create_yearly_drill_chart(df_yearly, df_monthly, filter_type="default", year=None, month=None, week=None):
-    """Create yearly drill-down chart.
-
-    If year is selected, shows monthly breakdown for that year.
-    Otherwise, shows year-by-year trend.
-    """
-    # If year is selected, show monthly breakdown
-    if year:
-        df = df_monthly.filter(pl.col("year") == year)
+@memoize_on_frames(prejson=True)
+def create_overview_yearly_chart(df, filter_type="default", year=None, month=None, week=None):
+    """Create yearly sales overview chart."""
+    df = apply_global_filter(df, filter_type, year, month, week)
 
-        if df.is_empty():
-            return go.Figure()
-
-        df_pd = df.to_pandas()
-
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=df_pd["year_month"],
-                y=df_pd["total_sales"],
-                mode="lines+markers",
-                name="Total Sales",
-                line=dict(color="royalblue", width=2),
-                marker=dict(size=6),
-            )
-        )
+    if df.is_empty():
+        return EMPTY_FIGURE
 
-        title = f"Monthly Sales - {year}"
-        xaxis_title = "Month"
-    else:
-        # Show yearly trend
-        df = df_yearly
+    title = chart_title("Yearly Sales", filter_type, year, month, week)
 
-        if df.is_empty():
-            return go.Figure()
-
-        df_pd = df.to_pandas()
-
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=df_pd["year"],
-                y=df_pd["total_sales"],
-                mode="lines+markers",
-                name="Total Sales",
-                line=dict(color="royalblue", width=2),
-                marker=dict(size=8),
-            )
+    # Use bar chart if single value, line chart for multiple years
+    if df.height == 1:
+        return bar_figure(
+            df["year"].cast(pl.Utf8).to_list(),
+            df["total_sales"].to_numpy(),
+            title,
+            "Year",
+            "royalblue",
+            tickangle=None,
+            hovermode="x unified",
+            text=euro_labels(df["total_sales"]),
+            textposition="outside",
         )
 
-        title = "Yearly Sales Trend"
-        xaxis_title = "Year"
-
-    fig.update_layout(
-        title=title,
-        xaxis_title=xaxis_title,
-        yaxis_title="Total Sales (€)",
-        height=400,
-        hovermode="x unified",
-    )
-
-    return fig
+    return line_figure(df["year"].to_numpy(), df["total_sales"].to_numpy(), title, "Year", "royalblue", 8)
 
 
-def create_yearly_region_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create yearly sales by region chart."""
+@memoize_on_frames(prejson=True)
+def create_overview_region_chart(df, filter_type="default", year=None, month=None, week=None):
+    """Create sales by region chart for overview."""
     df = apply_global_filter(df, filter_type, year, month, week)
 
     if df.is_empty():
-        return go.Figure()
-
-    # Aggregate by region
-    df = df.group_by("region").agg(pl.sum("total_sales")).sort("total_sales", descending=True)
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["region"],
-                y=df_pd["total_sales"],
-                marker_color="teal",
-            )
-        ]
-    )
+        return EMPTY_FIGURE
 
-    title = "Sales by Region" + get_filter_title(filter_type, year, month, week)
+    title = chart_title("Sales by Region", filter_type, year, month, week)
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Region",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
-    )
-
-    return fig
+    return bar_figure(df["region"].to_list(), df["total_sales"].to_numpy(), title, "Region", "teal")
 
 
-def create_yearly_category_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create yearly sales by category chart."""
+@memoize_on_frames(prejson=True)
+def create_overview_category_chart(df, filter_type="default", year=None, month=None, week=None):
+    """Create top categories chart for overview."""
     df = apply_global_filter(df, filter_type, year, month, week)
 
     if df.is_empty():
-        return go.Figure()
-
-    # Aggregate by category and get top 10
-    df = df.group_by("category").agg(pl.sum("total_sales")).sort("total_sales", descending=True).head(10)
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["category"],
-                y=df_pd["total_sales"],
-                marker_color="purple",
-            )
-        ]
-    )
+        return EMPTY_FIGURE
 
-    title = "Top 10 Categories" + get_filter_title(filter_type, year, month, week)
+    title = chart_title("Top 10 Categories", filter_type, year, month, week)
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Category",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
+    return bar_figure(
+        df["category"].to_list(), df["total_sales"].to_numpy(), title, "Category", "purple"
     )
 
-    return fig
-
 
 # ============================================================================
-# MONTHLY DRILL-DOWN TAB CHARTS (Shows daily breakdown for selected month)
+# YEARLY DRILL-DOWN TAB CHARTS
 # ============================================================================
 
-def create_monthly_drill_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create monthly drill-down chart (shows daily sales for the month)."""
-    df = apply_global_filter(df, filter_type, year, month, week)
-
-    if df.is_empty():
-        return go.Figure()
-
-    df_pd = df.to_pandas()
-
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=df_pd["date"],
-            y=df_pd["total_sales"],
-            mode="lines+markers",
-            name="Total Sales",
-            line=dict(color="orange", width=2),
-            marker=dict(size=4),
-        )
-    )
-
-    title = "Daily Sales" + get_filter_title(filter_type, year, month, week)
-
-    fig.update_layout(
-        title=title,
-        xaxis_title="Date",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        hovermode="x unified",
-    )
+@memoize_on_frames(prejson=True)
+def create_yearly_drill_chart(df_yearly, df_monthly, filter_type="default", year=None, month=None, week=None):
+    """Create yearly drill-down chart.
 
-    return fig
+    If year is selected, shows monthly breakdown for that year.
+    Otherwise, shows year-by-year trend.
+    """
+    # If year is selected, show monthly breakdown
+    if year:
+        df = df_monthly.filter(pl.col("year") == year)
 
+        if df.is_empty():
+            return EMPTY_FIGURE
+
+        return line_figure(
+            df["year_month"].to_list(),
+            df["total_sales"].to_numpy(),
+            f"Monthly Sales - {year}",
+            "Month",
+            "royalblue",
+            6,
+        )
 
-def create_monthly_region_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create monthly sales by region chart."""
-    df = apply_global_filter(df, filter_type, year, month, week)
+    # Show yearly trend
+    df = df_yearly
 
     if df.is_empty():
-        return go.Figure()
-
-    # Aggregate by region
-    df = df.group_by("region").agg(pl.sum("total_sales")).sort("total_sales", descending=True)
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["region"],
-                y=df_pd["total_sales"],
-                marker_color="teal",
-            )
-        ]
-    )
+        return EMPTY_FIGURE
 
-    title = "Sales by Region" + get_filter_title(filter_type, year, month, week)
-
-    fig.update_layout(
-        title=title,
-        xaxis_title="Region",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
+    return line_figure(
+        df["year"].to_numpy(), df["total_sales"].to_numpy(), "Yearly Sales Trend", "Year", "royalblue", 8
     )
 
-    return fig
-
 
-def create_monthly_category_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create monthly sales by category chart."""
-    df = apply_global_filter(df, filter_type, year, month, week)
-
-    if df.is_empty():
-        return go.Figure()
-
-    # Aggregate by category and get top 10
-    df = df.group_by("category").agg(pl.sum("total_sales")).sort("total_sales", descending=True).head(10)
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["category"],
-                y=df_pd["total_sales"],
-                marker_color="purple",
-            )
-        ]
-    )
+create_yearly_region_chart = create_region_chart
+create_yearly_category_chart = create_category_chart
 
-    title = "Top 10 Categories" + get_filter_title(filter_type, year, month, week)
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Category",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
-    )
+# ============================================================================
+# MONTHLY DRILL-DOWN TAB CHARTS (Shows daily breakdown for selected month)
+# ============================================================================
 
-    return fig
+create_monthly_drill_chart = partial(create_daily_drill_chart, color="orange", marker_size=4)
+create_monthly_region_chart = create_region_chart
+create_monthly_category_chart = create_category_chart
 
 
 # ============================================================================
 # WEEKLY DRILL-DOWN TAB CHARTS (Shows daily breakdown for selected week)
 # ============================================================================
 
-def create_weekly_drill_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create weekly drill-down chart (shows daily sales for the week)."""
-    df = apply_global_filter(df, filter_type, year, month, week)
-
-    if df.is_empty():
-        return go.Figure()
-
-    df_pd = df.to_pandas()
-
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=df_pd["date"],
-            y=df_pd["total_sales"],
-            mode="lines+markers",
-            name="Total Sales",
-            line=dict(color="green", width=2),
-            marker=dict(size=5),
-        )
-    )
-
-    title = "Daily Sales" + get_filter_title(filter_type, year, month, week)
-
-    fig.update_layout(
-        title=title,
-        xaxis_title="Date",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        hovermode="x unified",
-    )
-
-    return fig
-
-
-def create_weekly_region_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create weekly sales by region chart."""
-    df = apply_global_filter(df, filter_type, year, month, week)
-
-    if df.is_empty():
-        return go.Figure()
-
-    # Aggregate by region
-    df = df.group_by("region").agg(pl.sum("total_sales")).sort("total_sales", descending=True)
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["region"],
-                y=df_pd["total_sales"],
-                marker_color="teal",
-            )
-        ]
-    )
-
-    title = "Sales by Region" + get_filter_title(filter_type, year, month, week)
-
-    fig.update_layout(
-        title=title,
-        xaxis_title="Region",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
-    )
-
-    return fig
-
-
-def create_weekly_category_chart(df, filter_type="default", year=None, month=None, week=None):
-    """Create weekly sales by category chart."""
-    df = apply_global_filter(df, filter_type, year, month, week)
-
-    if df.is_empty():
-        return go.Figure()
-
-    # Aggregate by category and get top 10
-    df = df.group_by("category").agg(pl.sum("total_sales")).sort("total_sales", descending=True).head(10)
-    df_pd = df.to_pandas()
-
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=df_pd["category"],
-                y=df_pd["total_sales"],
-                marker_color="purple",
-            )
-        ]
-    )
-
-    title = "Top 10 Categories" + get_filter_title(filter_type, year, month, week)
-
-    fig.update_layout(
-        title=title,
-        xaxis_title="Category",
-        yaxis_title="Total Sales (€)",
-        height=400,
-        xaxis_tickangle=-45,
-    )
-
-    return fig
+create_weekly_drill_chart = partial(create_daily_drill_chart, color="green", marker_size=5)
+create_weekly_region_chart = create_region_chart
+create_weekly_category_chart = create_category_chart
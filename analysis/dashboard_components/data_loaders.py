@@ -1,74 +1,100 @@
 """Data loading functions for the dashboard."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 import polars as pl
 
 
-def load_yearly_sales(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_yearly.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_yearly_by_region(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_yearly_by_region.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_yearly_by_category(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_yearly_by_category.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_monthly_sales(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_monthly.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_monthly_by_region(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_monthly_by_region.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_monthly_by_category(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_monthly_by_category.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_weekly_sales(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_weekly.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_weekly_by_region(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_weekly_by_region.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_weekly_by_category(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_weekly_by_category.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_daily_sales(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_daily.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_daily_by_region(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_daily_by_region.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_daily_by_category(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_daily_by_category.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_sales_by_region(aggregated_dir: Path):
-    file_path = aggregated_dir / "sales_by_region.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
-
-
-def load_top_categories(aggregated_dir: Path):
-    file_path = aggregated_dir / "top_categories.parquet"
-    return pl.read_parquet(file_path) if file_path.exists() else pl.DataFrame()
+CATEGORICAL_COLUMNS = ("region", "category")
+
+
+def _with_categoricals(frame):
+    # Low-cardinality dimensions group and compare on integer codes
+    columns = frame.collect_schema().names()
+    return frame.with_columns(
+        [pl.col(c).cast(pl.Categorical) for c in CATEGORICAL_COLUMNS if c in columns]
+    )
+
+
+# Bounded so frames for superseded mtimes are evicted after pipeline re-runs
+@lru_cache(maxsize=32)
+def _read_cached(file_path: Path, mtime_ns: int, columns: tuple):
+    # Only the projected column chunks are decompressed
+    return _with_categoricals(pl.read_parquet(file_path, columns=list(columns) or None))
+
+
+def _read_parquet(file_path: Path, columns: tuple = ()):
+    # Keyed on mtime so a pipeline re-run is picked up without a restart
+    if not file_path.exists():
+        return pl.DataFrame()
+    return _read_cached(file_path, file_path.stat().st_mtime_ns, columns)
+
+
+@lru_cache(maxsize=32)
+def _scan_cached(file_path: Path, mtime_ns: int):
+    return _with_categoricals(pl.scan_parquet(file_path))
+
+
+def _scan_parquet(file_path: Path):
+    # Drill-down tables stay on disk; charts only materialize the filtered slice
+    if not file_path.exists():
+        return pl.LazyFrame()
+    return _scan_cached(file_path, file_path.stat().st_mtime_ns)
+
+
+# kind -> (file name, lazy, columns). Lazy tables are drill-downs that charts filter before
+# collecting, so their projection is pushed down by the query. Eager tables read only the
+# columns the dashboard uses; empty means all of them.
+_FILES = {
+    "yearly_sales": ("sales_yearly.parquet", False, ("year", "total_sales")),
+    "yearly_by_region": ("sales_yearly_by_region.parquet", True, ()),
+    "yearly_by_category": ("sales_yearly_by_category.parquet", True, ()),
+    "monthly_sales": ("sales_monthly.parquet", False, ("year", "month", "year_month", "total_sales")),
+    "monthly_by_region": ("sales_monthly_by_region.parquet", True, ()),
+    "monthly_by_category": ("sales_monthly_by_category.parquet", True, ()),
+    "weekly_sales": ("sales_weekly.parquet", False, ("iso_year", "iso_week", "total_sales")),
+    "weekly_by_region": ("sales_weekly_by_region.parquet", True, ()),
+    "weekly_by_category": ("sales_weekly_by_category.parquet", True, ()),
+    "daily_sales": ("sales_daily", True, ()),
+    "daily_by_region": ("sales_daily_by_region.parquet", True, ()),
+    "daily_by_category": ("sales_daily_by_category.parquet", True, ()),
+    "sales_by_region": ("sales_by_region.parquet", False, ("region", "total_sales")),
+    "top_categories": ("top_categories.parquet", False, ("category", "total_sales")),
+    "kpi_summary": ("kpi_summary.parquet", False, ()),
+    "region_slices": ("sales_slices_by_region", True, ()),
+    "category_slices": ("sales_slices_by_category", True, ()),
+}
+
+
+def load(kind: str, aggregated_dir: Path):
+    """Load a gold table by kind, eagerly or as a LazyFrame per `_FILES`."""
+    file_name, lazy, columns = _FILES[kind]
+    file_path = aggregated_dir / file_name
+    return _scan_parquet(file_path) if lazy else _read_parquet(file_path, columns)
+
+
+def preload(aggregated_dir: Path):
+    """Warm the loader caches for every gold table so the first callback doesn't pay for it."""
+    # Parquet decoding releases the GIL, so the reads overlap
+    with ThreadPoolExecutor(max_workers=len(_FILES)) as executor:
+        list(executor.map(partial(load, aggregated_dir=aggregated_dir), _FILES))
+
+
+load_yearly_sales = partial(load, "yearly_sales")
+load_yearly_by_region = partial(load, "yearly_by_region")
+load_yearly_by_category = partial(load, "yearly_by_category")
+load_monthly_sales = partial(load, "monthly_sales")
+load_monthly_by_region = partial(load, "monthly_by_region")
+load_monthly_by_category = partial(load, "monthly_by_category")
+load_weekly_sales = partial(load, "weekly_sales")
+load_weekly_by_region = partial(load, "weekly_by_region")
+load_weekly_by_category = partial(load, "weekly_by_category")
+load_daily_sales = partial(load, "daily_sales")
+load_daily_by_region = partial(load, "daily_by_region")
+load_daily_by_category = partial(load, "daily_by_category")
+load_sales_by_region = partial(load, "sales_by_region")
+load_top_categories = partial(load, "top_categories")
+load_kpi_summary = partial(load, "kpi_summary")
+load_region_slices = partial(load, "region_slices")
+load_category_slices = partial(load, "category_slices")
@@ -3,8 +3,11 @@
 import dash_bootstrap_components as dbc
 from dash import dcc, html
 
+# Resolved filter before the user picks anything; seeds the filter-state store
+DEFAULT_FILTER_STATE = {"filter_type": "default", "year": None, "month": None, "week": None}
 
-def create_global_filter():
+
+def create_global_filter(year_options=None):
     """Create the dynamic filter bar that changes based on active tab."""
     return dbc.Card(
         dbc.CardBody(
@@ -16,6 +19,7 @@ def create_global_filter():
                                 html.Label("Year", style={"fontSize": "0.85rem", "marginBottom": "4px", "fontWeight": "500"}),
                                 dcc.Dropdown(
                                     id="global-year",
+                                    options=year_options or [],
                                     placeholder="All years",
                                     clearable=True,
                                     style={"minWidth": "120px"},
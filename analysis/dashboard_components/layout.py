@@ -3,10 +3,17 @@
 import dash_bootstrap_components as dbc
 from dash import dcc, html
 
-from .filters import create_global_filter
+from .filters import DEFAULT_FILTER_STATE, create_global_filter
 
 
-def create_kpi_cards():
+def _graph(graph_id, initial):
+    """Graph seeded with its precomputed figure, when there is one."""
+    if graph_id in initial:
+        return dcc.Graph(id=graph_id, figure=initial[graph_id])
+    return dcc.Graph(id=graph_id)
+
+
+def create_kpi_cards(initial):
     """Create KPI summary cards."""
     return dbc.Row(
         [
@@ -15,7 +22,11 @@ def create_kpi_cards():
                     dbc.CardBody(
                         [
                             html.H6("Total Sales", className="text-muted"),
-                            html.H2(id="kpi-total-sales", className="text-success"),
+                            html.H2(
+                                initial.get("kpi-total-sales"),
+                                id="kpi-total-sales",
+                                className="text-success",
+                            ),
                         ]
                     )
                 ),
@@ -26,7 +37,11 @@ def create_kpi_cards():
                     dbc.CardBody(
                         [
                             html.H6("Total Transactions", className="text-muted"),
-                            html.H2(id="kpi-total-transactions", className="text-info"),
+                            html.H2(
+                                initial.get("kpi-total-transactions"),
+                                id="kpi-total-transactions",
+                                className="text-info",
+                            ),
                         ]
                     )
                 ),
@@ -37,7 +52,11 @@ def create_kpi_cards():
                     dbc.CardBody(
                         [
                             html.H6("Avg Transaction", className="text-muted"),
-                            html.H2(id="kpi-avg-transaction", className="text-primary"),
+                            html.H2(
+                                initial.get("kpi-avg-transaction"),
+                                id="kpi-avg-transaction",
+                                className="text-primary",
+                            ),
                         ]
                     )
                 ),
@@ -48,7 +67,11 @@ def create_kpi_cards():
                     dbc.CardBody(
                         [
                             html.H6("Years of Data", className="text-muted"),
-                            html.H2(id="kpi-years", className="text-warning"),
+                            html.H2(
+                                initial.get("kpi-years"),
+                                id="kpi-years",
+                                className="text-warning",
+                            ),
                         ]
                     )
                 ),
@@ -59,73 +82,83 @@ def create_kpi_cards():
     )
 
 
-def create_overview_tab():
+def create_overview_tab(initial):
     """Create the overview tab content."""
     return [
-        dcc.Graph(id="overview-yearly-chart"),
+        _graph("overview-yearly-chart", initial),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(id="overview-region-chart"), width=6),
-                dbc.Col(dcc.Graph(id="overview-category-chart"), width=6),
+                dbc.Col(_graph("overview-region-chart", initial), width=6),
+                dbc.Col(_graph("overview-category-chart", initial), width=6),
             ]
         ),
     ]
 
 
-def create_yearly_tab():
+def create_yearly_tab(initial):
     """Create the yearly drill-down tab content."""
     return [
-        dcc.Graph(id="yearly-drill-chart"),
+        _graph("yearly-drill-chart", initial),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(id="yearly-region-chart"), width=6),
-                dbc.Col(dcc.Graph(id="yearly-category-chart"), width=6),
+                dbc.Col(_graph("yearly-region-chart", initial), width=6),
+                dbc.Col(_graph("yearly-category-chart", initial), width=6),
             ]
         ),
     ]
 
 
-def create_monthly_tab():
+def create_monthly_tab(initial):
     """Create the monthly drill-down tab content (shows daily breakdown)."""
     return [
-        dcc.Graph(id="monthly-drill-chart"),
+        _graph("monthly-drill-chart", initial),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(id="monthly-region-chart"), width=6),
-                dbc.Col(dcc.Graph(id="monthly-category-chart"), width=6),
+                dbc.Col(_graph("monthly-region-chart", initial), width=6),
+                dbc.Col(_graph("monthly-category-chart", initial), width=6),
             ]
         ),
     ]
 
 
-def create_weekly_tab():
+def create_weekly_tab(initial):
     """Create the weekly drill-down tab content (shows daily breakdown)."""
     return [
-        dcc.Graph(id="weekly-drill-chart"),
+        _graph("weekly-drill-chart", initial),
         dbc.Row(
             [
-                dbc.Col(dcc.Graph(id="weekly-region-chart"), width=6),
-                dbc.Col(dcc.Graph(id="weekly-category-chart"), width=6),
+                dbc.Col(_graph("weekly-region-chart", initial), width=6),
+                dbc.Col(_graph("weekly-category-chart", initial), width=6),
             ]
         ),
     ]
 
 
-def create_layout():
-    """Create the main dashboard layout."""
+def create_layout(initial=None):
+    """Create the main dashboard layout.
+
+    `initial` maps the year dropdown, slice store, KPI and graph ids to their
+    default-filter values (see callbacks.initial_values). Their callbacks skip the initial call, so ids
+    missing from it stay empty until the filter changes.
+    """
+    initial = initial or {}
     return dbc.Container(
         [
             html.H1("Retail Business Dashboard", className="text-center my-4"),
-            create_kpi_cards(),
+            # Resolved (filter_type, year, month, week) shared by all chart callbacks
+            dcc.Store(id="filter-state", data=DEFAULT_FILTER_STATE),
+            # Pre-aggregated region/category slices for the clientside drill-down charts
+            dcc.Store(id="slice-store", data=initial.get("slice-store")),
+            create_kpi_cards(initial),
             # Tabs container with filters inside
             html.Div(
                 [
                     dbc.Tabs(
                         [
-                            dbc.Tab(create_overview_tab(), label="Overview", tab_id="overview"),
-                            dbc.Tab(create_yearly_tab(), label="Yearly Drill-Down", tab_id="yearly"),
-                            dbc.Tab(create_monthly_tab(), label="Monthly Drill-Down", tab_id="monthly"),
-                            dbc.Tab(create_weekly_tab(), label="Weekly Drill-Down", tab_id="weekly"),
+                            dbc.Tab(create_overview_tab(initial), label="Overview", tab_id="overview"),
+                            dbc.Tab(create_yearly_tab(initial), label="Yearly Drill-Down", tab_id="yearly"),
+                            dbc.Tab(create_monthly_tab(initial), label="Monthly Drill-Down", tab_id="monthly"),
+                            dbc.Tab(create_weekly_tab(initial), label="Weekly Drill-Down", tab_id="weekly"),
                         ],
                         id="tabs",
                         active_tab="overview",
@@ -133,7 +166,7 @@ def create_layout():
                     ),
                     # Floating filter overlay - positioned at top right
                     html.Div(
-                        create_global_filter(),
+                        create_global_filter(initial.get("global-year")),
                         style={
                             "position": "absolute",
                             "top": "10px",
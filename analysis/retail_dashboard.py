@@ -15,7 +15,8 @@ from dash import Dash
 
 # Import dashboard components
 from dashboard_components.layout import create_layout
-from dashboard_components.callbacks import register_callbacks
+from dashboard_components.callbacks import initial_values, register_callbacks
+from dashboard_components.data_loaders import preload
 
 # Load configuration
 with open(Path(__file__).parent.parent / "config.json") as f:
@@ -30,11 +31,21 @@ app = Dash(
     title="Retail Dashboard"
 )
 
+
+
+def serve_layout():
+    # Evaluated per page load, so a pipeline re-run shows up on refresh
+    return create_layout(initial_values(AGGREGATED_DIR))
+
+
 # Set the layout
-app.layout = create_layout()
+app.layout = serve_layout
 
 # Register all callbacks
 register_callbacks(app, AGGREGATED_DIR)
 
+# Read the gold tables up front instead of on the first user interaction
+preload(AGGREGATED_DIR)
+
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=8050)
@@ -31,10 +31,14 @@ def print_summary_report():
         print("No data found. Run the pipeline first.")
         return
 
-    sales_by_region = pl.read_parquet(AGGREGATED_DIR / "sales_by_region.parquet")
-    top_categories = pl.read_parquet(AGGREGATED_DIR / "top_categories.parquet")
-    daily_sales = pl.read_parquet(AGGREGATED_DIR / "sales_daily.parquet")
-    transactions = pl.read_parquet(CLEANED_DIR / "transactions_enriched.parquet")
+    sales_by_region = pl.read_parquet(
+        sales_file, columns=["region", "total_sales", "num_transactions", "num_stores"]
+    )
+    top_categories = pl.read_parquet(
+        AGGREGATED_DIR / "top_categories.parquet", columns=["category", "total_sales"]
+    )
+    daily_sales = pl.read_parquet(AGGREGATED_DIR / "sales_daily", columns=["date", "total_sales"])
+    transactions = pl.scan_parquet(CLEANED_DIR / "transactions_enriched.parquet")
 
     print("=" * 80)
     print("RETAIL BUSINESS INTELLIGENCE REPORT")
@@ -67,35 +71,38 @@ def print_summary_report():
         print(f"{row['category']:25s} €{row['total_sales']:>12,.2f}")
     print()
 
-    best_day = daily_sales.sort("total_sales", descending=True).head(1)
-    worst_day = daily_sales.sort("total_sales").head(1)
+    best_day = daily_sales.row(daily_sales["total_sales"].arg_max(), named=True)
+    worst_day = daily_sales.row(daily_sales["total_sales"].arg_min(), named=True)
     avg_daily = daily_sales["total_sales"].mean()
 
     print("SALES TRENDS")
-    for row in best_day.iter_rows(named=True):
-        print(f"Best Day:   {row['date']}  €{row['total_sales']:,.2f}")
-    for row in worst_day.iter_rows(named=True):
-        print(f"Worst Day:  {row['date']}  €{row['total_sales']:,.2f}")
+    print(f"Best Day:   {best_day['date']}  €{best_day['total_sales']:,.2f}")
+    print(f"Worst Day:  {worst_day['date']}  €{worst_day['total_sales']:,.2f}")
     print(f"Avg Daily:               €{avg_daily:,.2f}")
     print()
 
-    hourly_sales = (
-        transactions.group_by("hour")
-        .agg(pl.sum("total_amount").alias("sales"))
-        .sort("sales", descending=True)
+    # Collected together so polars can share the scan of the enriched file
+    hourly_sales, discounts = pl.collect_all(
+        [
+            transactions.group_by("hour")
+            .agg(pl.sum("total_amount").alias("sales"))
+            .sort("sales", descending=True)
+            .head(5),
+            transactions.select(
+                pl.col("discount_percent").mean().alias("avg_discount"),
+                pl.col("discount_amount").sum().alias("total_discount"),
+                ((pl.col("discount_percent") > 0).mean() * 100).alias("pct_with_discount"),
+            ),
+        ]
     )
 
     print("PEAK HOURS")
-    for row in hourly_sales.head(5).iter_rows(named=True):
+    for row in hourly_sales.iter_rows(named=True):
         hour = row["hour"]
         print(f"{hour:02d}:00-{hour+1:02d}:00  €{row['sales']:,.2f}")
     print()
 
-    avg_discount = transactions["discount_percent"].mean()
-    total_discount = transactions["discount_amount"].sum()
-    pct_with_discount = (
-        transactions.filter(pl.col("discount_percent") > 0).height / transactions.height
-    ) * 100
+    avg_discount, total_discount, pct_with_discount = discounts.row(0)
 
     print("DISCOUNTS")
     print(f"Avg Discount:      {avg_discount*100:.1f}%")
@@ -113,7 +120,7 @@ def export_csv():
     files = [
         ("sales_by_region.parquet", "sales_by_region.csv"),
         ("top_categories.parquet", "top_categories.csv"),
-        ("sales_daily.parquet", "sales_daily.csv"),
+        ("sales_daily", "sales_daily.csv"),
     ]
 
     for parquet_file, csv_file in files:
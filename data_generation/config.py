@@ -4,9 +4,16 @@ Configuration for data generation.
 
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
+def _global_config() -> dict:
+    with open(Path(__file__).parent.parent / "config.json") as f:
+        return json.load(f)
+
+
 @dataclass
 class DataGenConfig:
     seed: int
@@ -32,9 +39,7 @@ class DataGenConfig:
     def __post_init__(self):
         from datetime import datetime
 
-        config_path = Path(__file__).parent.parent / "config.json"
-        with open(config_path) as f:
-            global_config = json.load(f)
+        global_config = _global_config()
 
         if self.landing_dir is None:
             self.landing_dir = Path(global_config["landing_dir"])
@@ -106,9 +111,7 @@ class DataGenConfig:
             ]
 
     def ensure_directories(self):
-        config_path = Path(__file__).parent.parent / "config.json"
-        with open(config_path) as f:
-            global_config = json.load(f)
+        global_config = _global_config()
 
         self.landing_dir.mkdir(parents=True, exist_ok=True)
         Path(global_config["raw_dir"]).mkdir(parents=True, exist_ok=True)
@@ -125,12 +125,12 @@ def main():
 
     transaction_gen = TransactionGenerator(config)
 
-    transactions_df = transaction_gen.generate(
+    transaction_batches = transaction_gen.generate(
         num_transactions=config.num_transactions,
-        store_ids=stores_df["store_id"].to_list(),
-        product_ids=products_df["product_id"].to_list(),
+        store_ids=stores_df["store_id"].to_numpy(),
+        product_ids=products_df["product_id"].to_numpy(),
     )
-    transaction_gen.save(transactions_df)
+    transaction_gen.save(transaction_batches)
     print(f"\nAll data generated successfully in: {config.landing_dir}")
 
 
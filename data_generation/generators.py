@@ -2,49 +2,61 @@
 Deterministic data generators for German retail environment.
 """
 
-from datetime import datetime, timedelta
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 from config import DataGenConfig
+from dateutil.easter import easter
 from faker import Faker
 
 
+@lru_cache(maxsize=4)
+def _get_faker(locale: str) -> Faker:
+    # Loading a locale's providers is slow; share one instance per locale
+    return Faker(locale)
+
+
 class StoreGenerator:
 
     def __init__(self, config: DataGenConfig):
         self.config = config
-        self.fake = Faker(config.locale)
-        Faker.seed(config.seed)
-        np.random.seed(config.seed)
+        self.fake = _get_faker(config.locale)
+        self.fake.seed_instance(config.seed)
+        self.rng = np.random.default_rng(config.seed)
 
     def generate(self, num_stores: int) -> pl.DataFrame:
-        stores = []
-        for store_id in range(1, num_stores + 1):
-            region = np.random.choice(self.config.regions)
-
-            store = {
-                "store_id": store_id,
-                "store_name": f"ALDI SÜD {self.fake.city()}",
-                "street": self.fake.street_address(),
-                "city": self.fake.city(),
-                "postal_code": self.fake.postcode(),
-                "region": region,
-                "latitude": float(self.fake.latitude()),
-                "longitude": float(self.fake.longitude()),
-                "store_size_sqm": np.random.randint(800, 1500),
-                "opening_date": self.fake.date_between(
-                    start_date="-10y", end_date="-1y"
-                ),
+        fake = self.fake
+        stores = range(num_stores)
+
+        return pl.DataFrame(
+            {
+                "store_id": np.arange(1, num_stores + 1),
+                "store_name": [f"ALDI SÜD {fake.city()}" for _ in stores],
+                "street": [fake.street_address() for _ in stores],
+                "city": [fake.city() for _ in stores],
+                "postal_code": [fake.postcode() for _ in stores],
+                "region": self.rng.choice(self.config.regions, size=num_stores),
+                "latitude": [float(fake.latitude()) for _ in stores],
+                "longitude": [float(fake.longitude()) for _ in stores],
+                "store_size_sqm": self.rng.integers(800, 1500, size=num_stores),
+                "opening_date": [
+                    fake.date_between(start_date="-10y", end_date="-1y") for _ in stores
+                ],
             }
-            stores.append(store)
-
-        return pl.DataFrame(stores)
+        )
 
     def save(self, df: pl.DataFrame, filename: str = "stores.parquet"):
         output_path = self.config.landing_dir / filename
+        df = df.with_columns(pl.col("region").cast(pl.Categorical))
         df.write_parquet(
             output_path,
             compression=self.config.compression,
@@ -57,60 +69,74 @@ class ProductGenerator:
 
     def __init__(self, config: DataGenConfig):
         self.config = config
-        self.fake = Faker(config.locale)
-        Faker.seed(config.seed)
-        np.random.seed(config.seed)
-
-    def _generate_ean13(self, product_id: int) -> str:
-        country_code = "400"  # Germany
-        manufacturer = f"{product_id % 10000:04d}"
-        product = f"{product_id % 100000:05d}"
-
-        ean_without_check = country_code + manufacturer + product
-        odd_sum = sum(int(ean_without_check[i]) for i in range(0, 12, 2))
-        even_sum = sum(int(ean_without_check[i]) for i in range(1, 12, 2))
+        self.fake = _get_faker(config.locale)
+        self.fake.seed_instance(config.seed)
+        self.rng = np.random.default_rng(config.seed)
+
+    def _generate_ean13_batch(self, product_ids: np.ndarray) -> pl.Series:
+        country_code = 400  # Germany
+        manufacturer = product_ids % 10000
+        product = product_ids % 100000
+
+        ean_without_check = country_code * 10**9 + manufacturer * 10**5 + product
+        digits = ean_without_check[:, None] // 10 ** np.arange(11, -1, -1) % 10
+        odd_sum = digits[:, 0::2].sum(axis=1)
+        even_sum = digits[:, 1::2].sum(axis=1)
         check_digit = (10 - ((odd_sum + even_sum * 3) % 10)) % 10
 
-        return ean_without_check + str(check_digit)
+        return pl.Series(ean_without_check * 10 + check_digit).cast(pl.String)
+
+    def _price_range(self, category: str) -> tuple:
+        if "Getränke" in category or "Brot" in category:
+            return 0.49, 3.99
+        if "Fleisch" in category or "Molkerei" in category:
+            return 1.99, 12.99
+        if "Aktionswaren" in category:
+            return 4.99, 49.99
+        return 0.99, 9.99
 
     def generate(self, num_products: int) -> pl.DataFrame:
-        products = []
-        for product_id in range(1, num_products + 1):
-            category = np.random.choice(self.config.categories)
-
-            if "Getränke" in category or "Brot" in category:
-                base_price = np.random.uniform(0.49, 3.99)
-            elif "Fleisch" in category or "Molkerei" in category:
-                base_price = np.random.uniform(1.99, 12.99)
-            elif "Aktionswaren" in category:
-                base_price = np.random.uniform(4.99, 49.99)
-            else:
-                base_price = np.random.uniform(0.99, 9.99)
-
-            product = {
-                "product_id": product_id,
-                "ean": self._generate_ean13(product_id),
-                "product_name": f"{self.fake.word().capitalize()} {category.split()[0]}",
-                "category": category,
-                "subcategory": f"{category} - {self.fake.word().capitalize()}",
-                "brand": (
-                    self.fake.company()
-                    if np.random.random() > 0.3
-                    else "ALDI Eigenmarke"
-                ),
-                "unit_price": round(base_price, 2),
-                "unit_size": np.random.choice(
-                    ["250g", "500g", "1kg", "1L", "500ml", "100g"]
+        fake = self.fake
+        category_names = np.array(self.config.categories)
+        low, high = np.array([self._price_range(c) for c in category_names]).T
+
+        category_idx = self.rng.integers(len(category_names), size=num_products)
+        categories = category_names[category_idx]
+        base_prices = self.rng.uniform(low[category_idx], high[category_idx])
+        own_brand = self.rng.random(num_products) <= 0.3
+
+        product_ids = np.arange(1, num_products + 1)
+
+        return pl.DataFrame(
+            {
+                "product_id": product_ids,
+                "ean": self._generate_ean13_batch(product_ids),
+                "product_name": [
+                    f"{fake.word().capitalize()} {category.split()[0]}"
+                    for category in categories
+                ],
+                "category": categories,
+                "subcategory": [
+                    f"{category} - {fake.word().capitalize()}" for category in categories
+                ],
+                "brand": [
+                    "ALDI Eigenmarke" if own else fake.company() for own in own_brand
+                ],
+                "unit_price": np.round(base_prices, 2),
+                "unit_size": self.rng.choice(
+                    ["250g", "500g", "1kg", "1L", "500ml", "100g"], size=num_products
                 ),
-                "vat_rate": 0.19 if "Getränke" not in category else 0.07,  # German VAT
-                "is_active": np.random.random() > 0.05,  # 95% active products
+                # German VAT
+                "vat_rate": np.where(np.char.find(categories, "Getränke") >= 0, 0.07, 0.19),
+                "is_active": self.rng.random(num_products) > 0.05,  # 95% active products
             }
-            products.append(product)
-
-        return pl.DataFrame(products)
+        )
 
     def save(self, df: pl.DataFrame, filename: str = "products.parquet"):
         output_path = self.config.landing_dir / filename
+        df = df.with_columns(
+            pl.col("category", "subcategory", "unit_size", "brand").cast(pl.Categorical)
+        )
         df.write_parquet(
             output_path,
             compression=self.config.compression,
@@ -119,19 +145,111 @@ class ProductGenerator:
         return output_path
 
 
+# Rows per transactions Parquet row group (~128 MB uncompressed)
+ROW_GROUP_SIZE = 1_000_000
+
+PAYMENT_METHODS = pa.array(["EC-Karte", "Bargeld", "Kreditkarte"])
+
+TRANSACTION_SCHEMA = pa.schema(
+    [
+        ("transaction_id", pa.int64()),
+        ("store_id", pa.int64()),
+        ("product_id", pa.int64()),
+        ("transaction_datetime", pa.timestamp("us")),
+        ("quantity", pa.int64()),
+        ("discount_percent", pa.float64()),
+        ("payment_method", pa.dictionary(pa.int32(), pa.string())),
+    ]
+)
+
+# Hour-of-day traffic weights; index by hour (0-23)
+WEEKDAY_HOURLY = np.repeat(
+    [0.05, 0.5, 0.6, 0.8, 0.9, 1.0, 0.6, 0.1],  # morning rush, lunch, evening
+    [7, 2, 2, 3, 3, 2, 2, 3],
+)
+WEEKEND_HOURLY = np.repeat(
+    [0.05, 0.3, 0.7, 1.0, 0.8, 0.5, 0.1],  # slower start, peak 12-16
+    [8, 2, 2, 4, 2, 2, 4],
+)
+
+# Seasonal multipliers; index by month (1-12), slot 0 unused
+SEASONAL = np.array([
+    1.0,
+    0.85,  # January (post-holiday)
+    0.90,  # February
+    0.95,  # March
+    1.00,  # April
+    1.05,  # May
+    1.10,  # June
+    1.15,  # July (summer)
+    1.10,  # August
+    1.05,  # September
+    1.10,  # October
+    1.20,  # November (pre-Christmas)
+    1.40,  # December (Christmas shopping)
+])
+
+
+def _generate_year_transactions(
+    seed: np.random.SeedSequence,
+    year_dates: np.ndarray,
+    year_weights: np.ndarray,
+    num_transactions: int,
+    first_id: int,
+    store_ids: np.ndarray,
+    product_ids: np.ndarray,
+    avg_items: int,
+) -> list[pa.RecordBatch]:
+    rng = np.random.default_rng(seed)
+
+    # Inverse-CDF sampling of hours in proportion to their weights
+    cdf = np.cumsum(year_weights)
+    cdf /= cdf[-1]
+    sampled = np.searchsorted(cdf, rng.random(num_transactions), side="right")
+    random_seconds = rng.integers(0, 3600, size=num_transactions).astype("timedelta64[s]")
+    # Time-ordered rows keep row-group min/max statistics tight for date filters
+    transaction_dates = np.sort(year_dates[sampled] + random_seconds)
+
+    batch_size = ROW_GROUP_SIZE
+    batches = []
+
+    for batch_start in range(0, num_transactions, batch_size):
+        batch_end = min(batch_start + batch_size, num_transactions)
+        batch_size_actual = batch_end - batch_start
+
+        # Use Poisson distribution for items per transaction
+        quantities = rng.poisson(lam=avg_items, size=batch_size_actual)
+        quantities = np.clip(quantities, 1, 10)  # Ensure at least 1, max 10
+
+        store_sample = rng.choice(store_ids, size=batch_size_actual)
+        product_sample = rng.choice(product_ids, size=batch_size_actual)
+        discounts = rng.choice([0.0, 0.0, 0.0, 0.10, 0.15, 0.20, 0.25], size=batch_size_actual)
+        payment_codes = rng.choice(len(PAYMENT_METHODS), p=[0.6, 0.3, 0.1], size=batch_size_actual)
+
+        batches.append(
+            pa.RecordBatch.from_arrays(
+                [
+                    pa.array(np.arange(first_id + batch_start, first_id + batch_end)),
+                    pa.array(store_sample),
+                    pa.array(product_sample),
+                    pa.array(transaction_dates[batch_start:batch_end].astype("datetime64[us]")),
+                    pa.array(quantities),
+                    pa.array(discounts),
+                    pa.DictionaryArray.from_arrays(payment_codes.astype(np.int32), PAYMENT_METHODS),
+                ],
+                schema=TRANSACTION_SCHEMA,
+            )
+        )
+
+    return batches
+
+
 class TransactionGenerator:
 
     def __init__(self, config: DataGenConfig):
         self.config = config
-        self.fake = Faker(config.locale)
-        Faker.seed(config.seed)
-        np.random.seed(config.seed)
-
-    def _is_german_holiday(self, date: datetime) -> bool:
-        year = date.year
-        month = date.month
-        day = date.day
 
+    def _german_holidays(self, first_year: int, last_year: int) -> np.ndarray:
         # Fixed holidays
         fixed_holidays = [
             (1, 1),   # New Year
@@ -141,86 +259,23 @@ class TransactionGenerator:
             (12, 26), # Boxing Day
         ]
 
-        if (month, day) in fixed_holidays:
-            return True
-
-        # Easter calculation (using simple approximation)
-        if year == 2020 and month == 4 and day in [10, 12, 13]:  # Easter 2020
-            return True
-        if year == 2021 and month == 4 and day in [2, 4, 5]:     # Easter 2021
-            return True
-        if year == 2022 and month == 4 and day in [15, 17, 18]:  # Easter 2022
-            return True
-        if year == 2023 and month == 4 and day in [7, 9, 10]:    # Easter 2023
-            return True
-        if year == 2024 and month == 3 and day in [29, 31]:      # Easter 2024 (March)
-            return True
-        if year == 2024 and month == 4 and day == 1:             # Easter Monday 2024
-            return True
-        if year == 2025 and month == 4 and day in [18, 20, 21]:  # Easter 2025
-            return True
-
-        return False
-
-    def _get_hourly_traffic_pattern(self, hour: int, is_weekend: bool) -> float:
-        if is_weekend:
-            # Weekend pattern: slower start, peak 12-16
-            if hour < 8:
-                return 0.05
-            elif hour < 10:
-                return 0.3
-            elif hour < 12:
-                return 0.7
-            elif hour < 16:
-                return 1.0
-            elif hour < 18:
-                return 0.8
-            elif hour < 20:
-                return 0.5
-            else:
-                return 0.1
-        else:
-            # Weekday pattern: morning rush, lunch, evening
-            if hour < 7:
-                return 0.05
-            elif hour < 9:
-                return 0.5
-            elif hour < 11:
-                return 0.6
-            elif hour < 14:
-                return 0.8
-            elif hour < 17:
-                return 0.9
-            elif hour < 19:
-                return 1.0
-            elif hour < 21:
-                return 0.6
-            else:
-                return 0.1
-
-    def _get_seasonal_multiplier(self, month: int) -> float:
-        seasonal_multipliers = {
-            1: 0.85,  # January (post-holiday)
-            2: 0.90,  # February
-            3: 0.95,  # March
-            4: 1.00,  # April
-            5: 1.05,  # May
-            6: 1.10,  # June
-            7: 1.15,  # July (summer)
-            8: 1.10,  # August
-            9: 1.05,  # September
-            10: 1.10, # October
-            11: 1.20, # November (pre-Christmas)
-            12: 1.40, # December (Christmas shopping)
-        }
-        return seasonal_multipliers.get(month, 1.0)
+        # Days from Easter Sunday: Good Friday, Easter Sunday and Monday, Ascension, Whit Monday
+        easter_offsets = [-2, 0, 1, 39, 50]
+
+        holidays = set()
+        for year in range(first_year, last_year + 1):
+            holidays.update(date(year, month, day) for month, day in fixed_holidays)
+            easter_sunday = easter(year)
+            holidays.update(easter_sunday + timedelta(days=offset) for offset in easter_offsets)
+
+        return np.array(sorted(holidays), dtype="datetime64[D]")
 
     def generate(
         self,
         num_transactions: int,
-        store_ids: list,
-        product_ids: list,
-    ) -> pl.DataFrame:
+        store_ids: np.ndarray,
+        product_ids: np.ndarray,
+    ) -> Iterator[pa.RecordBatch]:
         # Parse dates from config
         start_date = datetime.strptime(self.config.start_date, "%Y-%m-%d")
         end_date = datetime.strptime(self.config.end_date, "%Y-%m-%d")
@@ -237,83 +292,54 @@ class TransactionGenerator:
         if remaining > 0:
             transactions_per_year[-1] += remaining
 
-        all_transaction_dates = []
+        if self.config.enable_holidays:
+            holidays = self._german_holidays(start_date.year, end_date.year)
 
-        for year_idx, year in enumerate(range(start_date.year, end_date.year + 1)):
-            year_start = datetime(year, 1, 1) if year > start_date.year else start_date
-            year_end = datetime(year, 12, 31, 23, 59, 59) if year < end_date.year else end_date
+        all_dates = pd.date_range(start=start_date, end=end_date, freq='h')
+        hours = all_dates.hour.to_numpy()
+        is_weekend = all_dates.weekday.to_numpy() >= 5
 
-            year_dates = pd.date_range(start=year_start, end=year_end, freq='h')
-            year_weights = []
+        weights = np.where(is_weekend, WEEKEND_HOURLY[hours], WEEKDAY_HOURLY[hours])
+        weights = weights * self.config.peak_hour_multiplier
+        if self.config.enable_seasonality:
+            weights = weights * SEASONAL[all_dates.month.to_numpy()]
 
-            for dt in year_dates:
-                is_holiday = self._is_german_holiday(dt) if self.config.enable_holidays else False
-                is_weekend = dt.weekday() >= 5
+        if self.config.enable_holidays:
+            is_holiday = np.isin(all_dates.values.astype("datetime64[D]"), holidays)
+            weights = np.where(is_holiday, 0.1, weights)
 
-                if is_holiday and self.config.enable_holidays:
-                    weight = 0.1
-                else:
-                    hour_weight = self._get_hourly_traffic_pattern(dt.hour, is_weekend) * self.config.peak_hour_multiplier
-                    seasonal_weight = self._get_seasonal_multiplier(dt.month) if self.config.enable_seasonality else 1.0
-                    weight = hour_weight * seasonal_weight
+        year_index = all_dates.year.to_numpy() - start_date.year
+        year_hours = [np.flatnonzero(year_index == year_idx) for year_idx in range(num_years)]
+        first_ids = np.cumsum([1] + transactions_per_year[:-1])
 
-                year_weights.append(weight)
-
-            year_weights = np.array(year_weights)
-            year_weights = year_weights / year_weights.sum()
-
-            num_year_transactions = transactions_per_year[year_idx]
-
-            sampled_indices = np.random.choice(
-                len(year_dates), size=num_year_transactions, p=year_weights, replace=True
+        # Years are independent once their counts are fixed; each gets its own seed
+        generate_year = partial(
+            _generate_year_transactions,
+            store_ids=np.asarray(store_ids, dtype=np.int64),
+            product_ids=np.asarray(product_ids, dtype=np.int64),
+            avg_items=self.config.avg_items_per_transaction,
+        )
+        with ProcessPoolExecutor(max_workers=min(num_years, os.cpu_count() or 1)) as executor:
+            results = executor.map(
+                generate_year,
+                np.random.SeedSequence(self.config.seed).spawn(num_years),
+                [all_dates.values[hours] for hours in year_hours],
+                [weights[hours] for hours in year_hours],
+                transactions_per_year,
+                first_ids,
             )
-            year_transaction_dates = year_dates[sampled_indices]
-
-            random_minutes = np.random.randint(0, 60, size=num_year_transactions)
-            random_seconds = np.random.randint(0, 60, size=num_year_transactions)
-            year_transaction_dates = year_transaction_dates + pd.to_timedelta(random_minutes, unit='m') + pd.to_timedelta(random_seconds, unit='s')
-
-            all_transaction_dates.append(year_transaction_dates.to_numpy())
-
-        transaction_dates = np.concatenate(all_transaction_dates)
-        num_transactions = len(transaction_dates)
-
-        transactions = []
-        batch_size = 100_000
-
-        for batch_start in range(0, num_transactions, batch_size):
-            batch_end = min(batch_start + batch_size, num_transactions)
-            batch_size_actual = batch_end - batch_start
+            for batches in results:
+                yield from batches
 
-            # Use Poisson distribution for items per transaction
-            quantities = np.random.poisson(lam=self.config.avg_items_per_transaction, size=batch_size_actual)
-            quantities = np.clip(quantities, 1, 10)  # Ensure at least 1, max 10
-
-            batch = {
-                "transaction_id": np.arange(batch_start + 1, batch_end + 1),
-                "store_id": np.random.choice(store_ids, size=batch_size_actual),
-                "product_id": np.random.choice(product_ids, size=batch_size_actual),
-                "transaction_datetime": transaction_dates[batch_start:batch_end],
-                "quantity": quantities,
-                "discount_percent": np.random.choice(
-                    [0.0, 0.0, 0.0, 0.10, 0.15, 0.20, 0.25], size=batch_size_actual
-                ),
-                "payment_method": np.random.choice(
-                    ["EC-Karte", "Bargeld", "Kreditkarte"],
-                    p=[0.6, 0.3, 0.1],
-                    size=batch_size_actual,
-                ),
-            }
-
-            transactions.append(pl.DataFrame(batch))
-
-        return pl.concat(transactions)
-
-    def save(self, df: pl.DataFrame, filename: str = "transactions.parquet"):
+    def save(self, batches: Iterable[pa.RecordBatch], filename: str = "transactions.parquet"):
         output_path = self.config.landing_dir / filename
-        df.write_parquet(
+        with pq.ParquetWriter(
             output_path,
+            TRANSACTION_SCHEMA,
             compression=self.config.compression,
             compression_level=self.config.compression_level,
-        )
+            write_statistics=True,
+        ) as writer:
+            for batch in batches:
+                writer.write_batch(batch, row_group_size=ROW_GROUP_SIZE)
         return output_path
@@ -7,14 +7,113 @@ by both Airflow and Prefect orchestrators.
 
 import json
 import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import polars as pl
+import pyarrow.parquet as pq
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bronze and silver files are re-read by the next stage straight away; lz4 decodes
+# faster than zstd. Gold outputs keep the configured codec.
+INTERMEDIATE_COMPRESSION = "lz4"
+
+# Gold tables built by gold_{name}(), independent of one another
+GOLD_TABLES = [
+    "yearly_sales",
+    "monthly_sales",
+    "weekly_sales",
+    "daily_sales",
+    "sales_by_region",
+    "top_categories",
+    "hourly_sales",
+    "discount_analysis",
+    "kpi_summary",
+    "sales_slices",
+]
+
+# Per-period drill-down tables, written as sales_{period}_{kind}.parquet
+DRILLDOWN_KINDS = {
+    "by_region": "sales by region",
+    "by_category": "sales by category",
+    "top_products": "top products",
+}
+
+# Drill-downs are sorted by period and scanned with period filters by the dashboard;
+# bounded row groups give the reader min/max statistics to skip the other periods
+DRILLDOWN_ROW_GROUP_SIZE = 100_000
+
+def _num_rows(file_path: Path) -> int:
+    # Row count from the parquet footer; no data pages are read
+    return pq.ParquetFile(file_path).metadata.num_rows
+
+
+def _with_year_month(frame: pl.LazyFrame) -> pl.LazyFrame:
+    # Formatted once per aggregated month rather than once per transaction
+    return frame.select(
+        "year",
+        "month",
+        pl.date("year", "month", 1).dt.strftime("%Y-%m").alias("year_month"),
+        pl.exclude("year", "month"),
+    )
+
+
+def _with_avg_transaction_value(
+    frame: pl.LazyFrame, after: str = "num_transactions"
+) -> pl.LazyFrame:
+    # Divides the aggregated totals, so total_amount is swept once per group-by
+    columns = frame.collect_schema().names()
+    position = columns.index(after) + 1
+    avg = pl.col("total_sales") / pl.col("num_transactions")
+    return frame.select(
+        columns[:position] + [avg.alias("avg_transaction_value")] + columns[position:]
+    )
+
+
+_TOTAL_SALES = pl.sum("total_amount").alias("total_sales")
+_NUM_TRANSACTIONS = pl.len().alias("num_transactions")
+_UNITS_SOLD = pl.sum("quantity").alias("total_units_sold")
+
+# period -> (group keys, sort keys, finishing step); the drill-down dimension follows
+# the group keys, and regions sort by name while categories and products rank by sales
+_DRILLDOWN_PERIODS = {
+    "yearly": (["year"], ["year"], None),
+    "monthly": (["year", "month"], ["year", "month"], _with_year_month),
+    "weekly": (["iso_year", "iso_week"], ["iso_year", "iso_week"], None),
+    "daily": (["year", "month", "date"], ["date"], None),
+}
+
+# kind -> (dimension, aggregations)
+_DRILLDOWN_SPECS = {
+    "by_region": ("region", [_TOTAL_SALES, _NUM_TRANSACTIONS]),
+    "by_category": ("category", [_TOTAL_SALES, _UNITS_SOLD]),
+    "top_products": ("product_id", [_TOTAL_SALES, _UNITS_SOLD]),
+}
+
+# The yearly tables carry extra measures: kind -> (aggregations, finishing step)
+_YEARLY_DRILLDOWNS = {
+    "by_region": ([_TOTAL_SALES, _NUM_TRANSACTIONS], _with_avg_transaction_value),
+    "by_category": ([_TOTAL_SALES, _NUM_TRANSACTIONS, _UNITS_SOLD], None),
+    "top_products": ([_TOTAL_SALES, _UNITS_SOLD, _NUM_TRANSACTIONS], None),
+}
+
+
+_silver_lock = threading.Lock()
+
+
+# A single entry: a newer mtime (silver re-run) evicts the previous frame
+@lru_cache(maxsize=1)
+def _read_silver(file_path: Path, mtime_ns: int) -> pl.DataFrame:
+    # Uncompressed IPC is memory-mapped without decoding; worker processes share the pages
+    return pl.read_ipc(file_path)
+
 
 class MedallionPipeline:
 
@@ -41,7 +140,7 @@ class MedallionPipeline:
         df = pl.read_parquet(self.landing_dir / "stores.parquet")
 
         output_path = self.raw_dir / "stores.parquet"
-        df.write_parquet(output_path, compression="zstd")
+        df.write_parquet(output_path, compression=INTERMEDIATE_COMPRESSION)
 
         logger.info(f"Bronze: Ingested {len(df)} stores to {output_path}")
         return len(df)
@@ -51,7 +150,7 @@ class MedallionPipeline:
         df = pl.read_parquet(self.landing_dir / "products.parquet")
 
         output_path = self.raw_dir / "products.parquet"
-        df.write_parquet(output_path, compression="zstd")
+        df.write_parquet(output_path, compression=INTERMEDIATE_COMPRESSION)
 
         logger.info(f"Bronze: Ingested {len(df)} products to {output_path}")
         return len(df)
@@ -62,10 +161,10 @@ class MedallionPipeline:
         output_path = self.raw_dir / "transactions.parquet"
 
         pl.scan_parquet(self.landing_dir / "transactions.parquet").sink_parquet(
-            output_path, compression="zstd"
+            output_path, compression=INTERMEDIATE_COMPRESSION
         )
 
-        count = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+        count = _num_rows(output_path)
         logger.info(f"Bronze: Ingested {count:,} transactions to {output_path}")
         return count
 
@@ -76,31 +175,25 @@ class MedallionPipeline:
         # Remove duplicates
         df = df.unique(subset=["store_id"])
 
-        # Validate geographic coordinates
-        df = df.with_columns(
-            [
-                pl.when(
-                    (pl.col("latitude").is_between(47.0, 55.0))
-                    & (pl.col("longitude").is_between(5.0, 15.0))
-                )
-                .then(True)
-                .otherwise(False)
-                .alias("valid_coordinates")
-            ]
-        )
+        # Validate geographic coordinates; missing coordinates count as invalid
+        valid_coordinates = (
+            pl.col("latitude").is_between(47.0, 55.0)
+            & pl.col("longitude").is_between(5.0, 15.0)
+        ).fill_null(False)
 
-        # Add quality score
+        # Quality score is 1.0 for valid coordinates and 0.5 otherwise
         df = df.with_columns(
             [
-                pl.when(pl.col("valid_coordinates"))
-                .then(1.0)
-                .otherwise(0.5)
-                .alias("data_quality_score")
+                valid_coordinates.alias("valid_coordinates"),
+                (0.5 + 0.5 * valid_coordinates.cast(pl.Float64)).alias("data_quality_score"),
             ]
         )
 
+        # Dictionary-encoded, so joins and group-bys downstream hash integer codes
+        df = df.with_columns(pl.col(["region", "city"]).cast(pl.Categorical))
+
         output_path = self.cleaned_dir / "stores_cleaned.parquet"
-        df.write_parquet(output_path, compression="zstd")
+        df.write_parquet(output_path, compression=INTERMEDIATE_COMPRESSION)
 
         logger.info(f"Silver: Cleaned {len(df)} stores to {output_path}")
         return len(df)
@@ -130,8 +223,12 @@ class MedallionPipeline:
             ]
         )
 
+        df = df.with_columns(
+            pl.col(["category", "subcategory", "brand", "unit_size"]).cast(pl.Categorical)
+        )
+
         output_path = self.cleaned_dir / "products_cleaned.parquet"
-        df.write_parquet(output_path, compression="zstd")
+        df.write_parquet(output_path, compression=INTERMEDIATE_COMPRESSION)
 
         logger.info(f"Silver: Cleaned {len(df)} products to {output_path}")
         return len(df)
@@ -141,20 +238,41 @@ class MedallionPipeline:
 
         output_path = self.cleaned_dir / "transactions_enriched.parquet"
 
-        transactions = pl.scan_parquet(self.raw_dir / "transactions.parquet")
-        stores = pl.scan_parquet(self.cleaned_dir / "stores_cleaned.parquet")
-        products = pl.scan_parquet(self.cleaned_dir / "products_cleaned.parquet")
-
+        # Only the columns the gold layer uses are decoded from the largest input
+        transactions = pl.scan_parquet(self.raw_dir / "transactions.parquet").select(
+            [
+                "transaction_id",
+                "store_id",
+                "product_id",
+                "transaction_datetime",
+                "quantity",
+                "discount_percent",
+            ]
+        )
+        # Dimensions are small: read them up front so each join builds its hash table
+        # from an in-memory frame and the transactions stream past it
+        stores = pl.read_parquet(
+            self.cleaned_dir / "stores_cleaned.parquet", columns=["store_id", "region", "city"]
+        ).lazy()
+        products = pl.read_parquet(
+            self.cleaned_dir / "products_cleaned.parquet",
+            columns=["product_id", "category", "unit_price", "price_incl_vat"],
+        ).lazy()
+
+        # Joins keep the landing files' chronological order, so each row group covers
+        # a narrow time range and its min/max statistics can skip date-filtered reads
         df = (
             transactions.join(
-                stores.select(["store_id", "region", "city"]), on="store_id", how="inner"
+                stores,
+                on="store_id",
+                how="inner",
+                maintain_order="left",
             )
             .join(
-                products.select(
-                    ["product_id", "category", "unit_price", "price_incl_vat"]
-                ),
+                products,
                 on="product_id",
                 how="inner",
+                maintain_order="left",
             )
             .with_columns(
                 [
@@ -181,33 +299,57 @@ class MedallionPipeline:
                     pl.col("transaction_datetime").dt.month().alias("month"),
                     pl.col("transaction_datetime").dt.weekday().alias("weekday"),
                     pl.col("transaction_datetime").dt.hour().alias("hour"),
+                    # Extracted once here instead of in every weekly and daily gold query
+                    pl.col("transaction_datetime").dt.date().alias("date"),
+                    pl.col("transaction_datetime").dt.week().alias("iso_week"),
                 ]
             )
         )
 
-        df.sink_parquet(output_path, compression="zstd")
+        # One pass feeds both copies: parquet for the report and other readers, Arrow IPC
+        # for the gold layer
+        ipc_path = self.cleaned_dir / "transactions_enriched.arrow"
+        staging_path = ipc_path.with_suffix(".arrow.tmp")
+        pl.collect_all(
+            [
+                df.sink_parquet(output_path, compression=INTERMEDIATE_COMPRESSION, lazy=True),
+                df.sink_ipc(staging_path, lazy=True),
+            ]
+        )
+        # Replaced rather than overwritten, so frames still mapped from the old file stay valid
+        os.replace(staging_path, ipc_path)
 
-        count = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+        count = _num_rows(output_path)
+        # Warm the in-memory copy for the gold layer while the orchestrator records this task
+        threading.Thread(target=self.load_silver_transactions, daemon=True).start()
         logger.info(f"Silver: Enriched {count:,} transactions to {output_path}")
         return count
 
+    def load_silver_transactions(self) -> pl.LazyFrame:
+        # Read once per process and shared by every gold aggregation; the lock keeps
+        # concurrent gold tasks from each loading their own copy
+        file_path = self.cleaned_dir / "transactions_enriched.arrow"
+        with _silver_lock:
+            df = _read_silver(file_path, file_path.stat().st_mtime_ns)
+        return df.lazy()
+
     def gold_yearly_sales(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating yearly sales")
 
         output_path = self.aggregated_dir / "sales_yearly.parquet"
 
         yearly_sales = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
+            self.load_silver_transactions()
             .group_by("year")
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
+                    pl.len().alias("num_transactions"),
                     pl.n_unique("store_id").alias("num_stores"),
                     pl.n_unique("category").alias("num_categories"),
                 ]
             )
+            .pipe(_with_avg_transaction_value)
             .sort("year")
             .collect()
         )
@@ -227,18 +369,16 @@ class MedallionPipeline:
         output_path = self.aggregated_dir / "sales_monthly.parquet"
 
         monthly_sales = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [pl.col("transaction_datetime").dt.strftime("%Y-%m").alias("year_month")]
-            )
-            .group_by(["year", "month", "year_month"])
+            self.load_silver_transactions()
+            .group_by(["year", "month"])
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
+                    pl.len().alias("num_transactions"),
                 ]
             )
+            .pipe(_with_avg_transaction_value)
+            .pipe(_with_year_month)
             .sort(["year", "month"])
             .collect()
         )
@@ -258,21 +398,16 @@ class MedallionPipeline:
         output_path = self.aggregated_dir / "sales_weekly.parquet"
 
         weekly_sales = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [
-                    pl.col("transaction_datetime").dt.year().alias("iso_year"),
-                    pl.col("transaction_datetime").dt.week().alias("iso_week"),
-                ]
-            )
+            self.load_silver_transactions()
+            .with_columns([pl.col("year").alias("iso_year")])
             .group_by(["iso_year", "iso_week"])
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
+                    pl.len().alias("num_transactions"),
                 ]
             )
+            .pipe(_with_avg_transaction_value)
             .sort(["iso_year", "iso_week"])
             .collect()
         )
@@ -289,27 +424,28 @@ class MedallionPipeline:
     def gold_daily_sales(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating daily sales")
 
-        output_path = self.aggregated_dir / "sales_daily.parquet"
+        output_dir = self.aggregated_dir / "sales_daily"
 
         daily_sales = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns([pl.col("transaction_datetime").dt.date().alias("date")])
+            self.load_silver_transactions()
             .group_by(["year", "month", "date"])
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
+                    pl.len().alias("num_transactions"),
                     pl.n_unique("category").alias("num_categories"),
                 ]
             )
+            .pipe(_with_avg_transaction_value)
             .sort("date")
             .collect()
         )
 
-        daily_sales.write_parquet(output_path, compression=self.compression)
+        # One file per year so filtered drill-downs only open the years they need
+        shutil.rmtree(output_dir, ignore_errors=True)
+        daily_sales.write_parquet(output_dir, compression=self.compression, partition_by="year")
 
-        logger.info(f"Gold: Daily sales saved to {output_path}")
+        logger.info(f"Gold: Daily sales saved to {output_dir}")
 
         return {
             "num_days": len(daily_sales),
@@ -323,16 +459,16 @@ class MedallionPipeline:
         output_path = self.aggregated_dir / "sales_by_region.parquet"
 
         sales_by_region = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
+            self.load_silver_transactions()
             .group_by("region")
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
+                    pl.len().alias("num_transactions"),
                     pl.n_unique("store_id").alias("num_stores"),
                 ]
             )
+            .pipe(_with_avg_transaction_value)
             .sort("total_sales", descending=True)
             .collect()
         )
@@ -352,16 +488,17 @@ class MedallionPipeline:
         output_path = self.aggregated_dir / "top_categories.parquet"
 
         category_performance = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
+            self.load_silver_transactions()
             .group_by("category")
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
+                    pl.len().alias("num_transactions"),
                     pl.sum("quantity").alias("total_units_sold"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
                 ]
             )
+            .pipe(_with_avg_transaction_value, after="total_units_sold")
+            # Polars plans sort + head as a bounded top-k, not a full sort
             .sort("total_sales", descending=True)
             .head(top_n)
             .collect()
@@ -382,7 +519,7 @@ class MedallionPipeline:
         output_path = self.aggregated_dir / "hourly_sales.parquet"
 
         hourly_sales = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
+            self.load_silver_transactions()
             .group_by(["weekday", "hour"])
             .agg(pl.sum("total_amount").alias("sales"))
             .sort(["weekday", "hour"])
@@ -404,29 +541,26 @@ class MedallionPipeline:
         output_path = self.aggregated_dir / "discount_analysis.parquet"
 
         discount_buckets = (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
+            self.load_silver_transactions()
             .with_columns(
-                [
-                    pl.when(pl.col("discount_percent") == 0)
-                    .then(pl.lit("No Discount"))
-                    .when(pl.col("discount_percent") <= 0.10)
-                    .then(pl.lit("1-10%"))
-                    .when(pl.col("discount_percent") <= 0.20)
-                    .then(pl.lit("11-20%"))
-                    .when(pl.col("discount_percent") <= 0.30)
-                    .then(pl.lit("21-30%"))
-                    .otherwise(pl.lit("30%+"))
-                    .alias("discount_bucket")
-                ]
+                # Right-closed bins matching "no discount", <=10%, <=20%, <=30% and above;
+                # cut yields a Categorical, so the group-by hashes codes, not labels
+                pl.col("discount_percent")
+                .cut(
+                    [0, 0.10, 0.20, 0.30],
+                    labels=["No Discount", "1-10%", "11-20%", "21-30%", "30%+"],
+                )
+                .alias("discount_bucket")
             )
             .group_by("discount_bucket")
             .agg(
                 [
-                    pl.count("transaction_id").alias("num_transactions"),
+                    pl.len().alias("num_transactions"),
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
                 ]
             )
+            .pipe(_with_avg_transaction_value, after="total_sales")
+            .with_columns(pl.col("discount_bucket").cast(pl.String))
             .collect()
         )
 
@@ -439,326 +573,226 @@ class MedallionPipeline:
             "total_sales": float(discount_buckets["total_sales"].sum()),
         }
 
-    def gold_yearly_by_region(self) -> Dict[str, Any]:
-        logger.info("Gold: Calculating yearly sales by region")
+    def gold_kpi_summary(self) -> Dict[str, Any]:
+        logger.info("Gold: Calculating KPI summary")
 
-        output_path = self.aggregated_dir / "sales_yearly_by_region.parquet"
+        output_path = self.aggregated_dir / "kpi_summary.parquet"
 
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .group_by(["year", "region"])
+        yearly = (
+            self.load_silver_transactions()
+            .group_by("year")
             .agg(
                 [
                     pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.mean("total_amount").alias("avg_transaction_value"),
+                    pl.len().alias("num_transactions"),
+                    pl.lit(1, dtype=pl.UInt32).alias("num_years"),
                 ]
             )
-            .sort(["year", "region"])
-            .sink_parquet(output_path, compression=self.compression)
         )
 
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Yearly sales by region saved to {output_path}")
-
-        return {"num_rows": num_rows}
-
-    def gold_yearly_by_category(self) -> Dict[str, Any]:
-        logger.info("Gold: Calculating yearly sales by category")
-
-        output_path = self.aggregated_dir / "sales_yearly_by_category.parquet"
+        # One row per year plus a null-year row for the unfiltered totals
+        overall = yearly.select(
+            [
+                pl.lit(None, dtype=pl.Int32).alias("year"),
+                pl.sum("total_sales"),
+                pl.sum("num_transactions"),
+                pl.len().alias("num_years"),
+            ]
+        )
 
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .group_by(["year", "category"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
+        kpi_summary = (
+            pl.concat([yearly, overall])
+            .with_columns(
+                (pl.col("total_sales") / pl.col("num_transactions")).alias(
+                    "avg_transaction_value"
+                )
             )
-            .sort(["year", "total_sales"], descending=[False, True])
-            .sink_parquet(output_path, compression=self.compression)
+            .sort("year", nulls_last=True)
+            .collect()
         )
 
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+        kpi_summary.write_parquet(output_path, compression=self.compression)
 
-        logger.info(f"Gold: Yearly sales by category saved to {output_path}")
+        logger.info(f"Gold: KPI summary saved to {output_path}")
 
-        return {"num_rows": num_rows}
+        return {"num_rows": len(kpi_summary)}
 
-    def gold_yearly_top_products(self) -> Dict[str, Any]:
-        logger.info("Gold: Calculating yearly top products")
+    def gold_sales_slices(self) -> Dict[str, Any]:
+        logger.info("Gold: Pre-aggregating dashboard sales slices")
 
-        output_path = self.aggregated_dir / "sales_yearly_top_products.parquet"
+        transactions = self.load_silver_transactions().with_columns(
+            [pl.col("transaction_datetime").dt.iso_year().alias("iso_year")]
+        )
 
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .group_by(["year", "product_id"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                ]
+        # grain -> {output key: source column}; weeks are keyed by ISO year
+        slice_keys = {
+            "all": {},
+            "year": {"year": "year"},
+            "month": {"year": "year", "month": "month"},
+            "week": {"year": "iso_year", "week": "iso_week"},
+        }
+        key_types = {"year": pl.Int32, "month": pl.Int8, "week": pl.Int8}
+
+        num_rows = 0
+        for dimension in ["region", "category"]:
+            slices = []
+            for grain, keys in slice_keys.items():
+                slices.append(
+                    transactions.group_by(list(keys.values()) + [dimension])
+                    .agg(pl.sum("total_amount").alias("total_sales"))
+                    .select(
+                        [pl.lit(grain).alias("grain")]
+                        + [
+                            (pl.col(keys[key]) if key in keys else pl.lit(None))
+                            .cast(dtype)
+                            .alias(key)
+                            for key, dtype in key_types.items()
+                        ]
+                        + [pl.col(dimension), pl.col("total_sales")]
+                    )
+                )
+
+            output_dir = self.aggregated_dir / f"sales_slices_by_{dimension}"
+            # Each slice is stored largest-first, so lookups only filter and take the head
+            df = (
+                pl.concat(slices)
+                .sort(
+                    ["grain", "year", "month", "week", "total_sales"],
+                    descending=[False, False, False, False, True],
+                )
+                .collect()
             )
-            .sort(["year", "total_sales"], descending=[False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
 
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+            # Rewrite the whole dataset so no stale partition survives
+            shutil.rmtree(output_dir, ignore_errors=True)
+            df.write_parquet(output_dir, compression=self.compression, partition_by="grain")
+            num_rows += len(df)
 
-        logger.info(f"Gold: Yearly top products saved to {output_path}")
+            logger.info(f"Gold: Sales slices by {dimension} saved to {output_dir}")
 
         return {"num_rows": num_rows}
 
-    def gold_monthly_by_region(self) -> Dict[str, Any]:
-        logger.info("Gold: Calculating monthly sales by region")
+    # DRILL-DOWNS: one scan per period feeds its region, category and product tables.
+    # Top products keep every product, fully sorted by sales within each period.
+
+    def _period_transactions(self, period: str) -> pl.LazyFrame:
+        transactions = self.load_silver_transactions()
+        # date and iso_week come precomputed from silver
+        period_columns = {
+            "yearly": [],
+            "monthly": [],
+            "weekly": [pl.col("year").alias("iso_year")],
+            "daily": [],
+        }[period]
+        return transactions.with_columns(period_columns) if period_columns else transactions
+
+    def _drilldown_query(
+        self, period: str, kind: str, transactions: pl.LazyFrame
+    ) -> pl.LazyFrame:
+        period_keys, sort_keys, finish = _DRILLDOWN_PERIODS[period]
+        dimension, aggregations = _DRILLDOWN_SPECS[kind]
+        if period == "yearly":
+            aggregations, finish = _YEARLY_DRILLDOWNS[kind]
+
+        frame = transactions.group_by(period_keys + [dimension]).agg(aggregations)
+        if finish is not None:
+            frame = frame.pipe(finish)
+        if kind == "by_region":
+            return frame.sort(sort_keys + [dimension])
+        return frame.sort(
+            sort_keys + ["total_sales"], descending=[False] * len(sort_keys) + [True]
+        )
 
-        output_path = self.aggregated_dir / "sales_monthly_by_region.parquet"
+    def _run_drilldowns(self, period: str, kinds: List[str]) -> Dict[str, Dict[str, Any]]:
+        transactions = self._period_transactions(period)
 
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [pl.col("transaction_datetime").dt.strftime("%Y-%m").alias("year_month")]
-            )
-            .group_by(["year", "month", "year_month", "region"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                ]
-            )
-            .sort(["year", "month", "region"])
-            .sink_parquet(output_path, compression=self.compression)
+        # Sinking together lets polars share the scan and the derived period columns
+        output_paths = {
+            kind: self.aggregated_dir / f"sales_{period}_{kind}.parquet" for kind in kinds
+        }
+        pl.collect_all(
+            [
+                self._drilldown_query(period, kind, transactions).sink_parquet(
+                    output_path,
+                    compression=self.compression,
+                    row_group_size=DRILLDOWN_ROW_GROUP_SIZE,
+                    lazy=True,
+                )
+                for kind, output_path in output_paths.items()
+            ]
         )
 
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Monthly sales by region saved to {output_path}")
+        results = {}
+        for kind, output_path in output_paths.items():
+            num_rows = _num_rows(output_path)
+            logger.info(f"Gold: {period.capitalize()} {DRILLDOWN_KINDS[kind]} saved to {output_path}")
+            results[f"{period}_{kind}"] = {"num_rows": num_rows}
 
-        return {"num_rows": num_rows}
+        return results
 
-    def gold_monthly_by_category(self) -> Dict[str, Any]:
-        logger.info("Gold: Calculating monthly sales by category")
+    def gold_yearly_by_region(self) -> Dict[str, Any]:
+        logger.info("Gold: Calculating yearly sales by region")
+        return self._run_drilldowns("yearly", ["by_region"])["yearly_by_region"]
 
-        output_path = self.aggregated_dir / "sales_monthly_by_category.parquet"
+    def gold_yearly_by_category(self) -> Dict[str, Any]:
+        logger.info("Gold: Calculating yearly sales by category")
+        return self._run_drilldowns("yearly", ["by_category"])["yearly_by_category"]
 
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [pl.col("transaction_datetime").dt.strftime("%Y-%m").alias("year_month")]
-            )
-            .group_by(["year", "month", "year_month", "category"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
-            )
-            .sort(["year", "month", "total_sales"], descending=[False, False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
+    def gold_yearly_top_products(self) -> Dict[str, Any]:
+        logger.info("Gold: Calculating yearly top products")
+        return self._run_drilldowns("yearly", ["top_products"])["yearly_top_products"]
 
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+    def gold_yearly_drilldowns(self) -> Dict[str, Dict[str, Any]]:
+        logger.info("Gold: Calculating yearly drill-downs")
+        return self._run_drilldowns("yearly", list(DRILLDOWN_KINDS))
 
-        logger.info(f"Gold: Monthly sales by category saved to {output_path}")
+    def gold_monthly_by_region(self) -> Dict[str, Any]:
+        logger.info("Gold: Calculating monthly sales by region")
+        return self._run_drilldowns("monthly", ["by_region"])["monthly_by_region"]
 
-        return {"num_rows": num_rows}
+    def gold_monthly_by_category(self) -> Dict[str, Any]:
+        logger.info("Gold: Calculating monthly sales by category")
+        return self._run_drilldowns("monthly", ["by_category"])["monthly_by_category"]
 
     def gold_monthly_top_products(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating monthly top products")
+        return self._run_drilldowns("monthly", ["top_products"])["monthly_top_products"]
 
-        output_path = self.aggregated_dir / "sales_monthly_top_products.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [pl.col("transaction_datetime").dt.strftime("%Y-%m").alias("year_month")]
-            )
-            .group_by(["year", "month", "year_month", "product_id"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
-            )
-            .sort(["year", "month", "total_sales"], descending=[False, False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Monthly top products saved to {output_path}")
-
-        return {"num_rows": num_rows}
+    def gold_monthly_drilldowns(self) -> Dict[str, Dict[str, Any]]:
+        logger.info("Gold: Calculating monthly drill-downs")
+        return self._run_drilldowns("monthly", list(DRILLDOWN_KINDS))
 
     def gold_weekly_by_region(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating weekly sales by region")
-
-        output_path = self.aggregated_dir / "sales_weekly_by_region.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [
-                    pl.col("transaction_datetime").dt.year().alias("iso_year"),
-                    pl.col("transaction_datetime").dt.week().alias("iso_week"),
-                ]
-            )
-            .group_by(["iso_year", "iso_week", "region"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                ]
-            )
-            .sort(["iso_year", "iso_week", "region"])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Weekly sales by region saved to {output_path}")
-
-        return {"num_rows": num_rows}
+        return self._run_drilldowns("weekly", ["by_region"])["weekly_by_region"]
 
     def gold_weekly_by_category(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating weekly sales by category")
-
-        output_path = self.aggregated_dir / "sales_weekly_by_category.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [
-                    pl.col("transaction_datetime").dt.year().alias("iso_year"),
-                    pl.col("transaction_datetime").dt.week().alias("iso_week"),
-                ]
-            )
-            .group_by(["iso_year", "iso_week", "category"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
-            )
-            .sort(["iso_year", "iso_week", "total_sales"], descending=[False, False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Weekly sales by category saved to {output_path}")
-
-        return {"num_rows": num_rows}
+        return self._run_drilldowns("weekly", ["by_category"])["weekly_by_category"]
 
     def gold_weekly_top_products(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating weekly top products")
+        return self._run_drilldowns("weekly", ["top_products"])["weekly_top_products"]
 
-        output_path = self.aggregated_dir / "sales_weekly_top_products.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns(
-                [
-                    pl.col("transaction_datetime").dt.year().alias("iso_year"),
-                    pl.col("transaction_datetime").dt.week().alias("iso_week"),
-                ]
-            )
-            .group_by(["iso_year", "iso_week", "product_id"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
-            )
-            .sort(["iso_year", "iso_week", "total_sales"], descending=[False, False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Weekly top products saved to {output_path}")
-
-        return {"num_rows": num_rows}
+    def gold_weekly_drilldowns(self) -> Dict[str, Dict[str, Any]]:
+        logger.info("Gold: Calculating weekly drill-downs")
+        return self._run_drilldowns("weekly", list(DRILLDOWN_KINDS))
 
     def gold_daily_by_region(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating daily sales by region")
-
-        output_path = self.aggregated_dir / "sales_daily_by_region.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns([pl.col("transaction_datetime").dt.date().alias("date")])
-            .group_by(["year", "month", "date", "region"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.count("transaction_id").alias("num_transactions"),
-                ]
-            )
-            .sort(["date", "region"])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Daily sales by region saved to {output_path}")
-
-        return {"num_rows": num_rows}
+        return self._run_drilldowns("daily", ["by_region"])["daily_by_region"]
 
     def gold_daily_by_category(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating daily sales by category")
-
-        output_path = self.aggregated_dir / "sales_daily_by_category.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns([pl.col("transaction_datetime").dt.date().alias("date")])
-            .group_by(["year", "month", "date", "category"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
-            )
-            .sort(["date", "total_sales"], descending=[False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Daily sales by category saved to {output_path}")
-
-        return {"num_rows": num_rows}
+        return self._run_drilldowns("daily", ["by_category"])["daily_by_category"]
 
     def gold_daily_top_products(self) -> Dict[str, Any]:
         logger.info("Gold: Calculating daily top products")
+        return self._run_drilldowns("daily", ["top_products"])["daily_top_products"]
 
-        output_path = self.aggregated_dir / "sales_daily_top_products.parquet"
-
-        (
-            pl.scan_parquet(self.cleaned_dir / "transactions_enriched.parquet")
-            .with_columns([pl.col("transaction_datetime").dt.date().alias("date")])
-            .group_by(["year", "month", "date", "product_id"])
-            .agg(
-                [
-                    pl.sum("total_amount").alias("total_sales"),
-                    pl.sum("quantity").alias("total_units_sold"),
-                ]
-            )
-            .sort(["date", "total_sales"], descending=[False, True])
-            .sink_parquet(output_path, compression=self.compression)
-        )
-
-        num_rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-
-        logger.info(f"Gold: Daily top products saved to {output_path}")
-
-        return {"num_rows": num_rows}
+    def gold_daily_drilldowns(self) -> Dict[str, Dict[str, Any]]:
+        logger.info("Gold: Calculating daily drill-downs")
+        return self._run_drilldowns("daily", list(DRILLDOWN_KINDS))
 
     # FULL PIPELINE EXECUTION
 
@@ -789,14 +823,13 @@ class MedallionPipeline:
         logger.info("=" * 80)
         logger.info("GOLD LAYER - Business Aggregations")
         logger.info("=" * 80)
-        results["gold"]["yearly_sales"] = self.gold_yearly_sales()
-        results["gold"]["monthly_sales"] = self.gold_monthly_sales()
-        results["gold"]["weekly_sales"] = self.gold_weekly_sales()
-        results["gold"]["daily_sales"] = self.gold_daily_sales()
-        results["gold"]["sales_by_region"] = self.gold_sales_by_region()
-        results["gold"]["top_categories"] = self.gold_top_categories()
-        results["gold"]["hourly_sales"] = self.gold_hourly_sales()
-        results["gold"]["discount_analysis"] = self.gold_discount_analysis()
+        # Polars releases the GIL, so the aggregations over the shared in-memory
+        # silver frame run side by side instead of one after another
+        with ThreadPoolExecutor(max_workers=len(GOLD_TABLES)) as executor:
+            futures = {
+                name: executor.submit(getattr(self, f"gold_{name}")) for name in GOLD_TABLES
+            }
+            results["gold"] = {name: future.result() for name, future in futures.items()}
 
         logger.info("=" * 80)
         logger.info("PIPELINE COMPLETE")